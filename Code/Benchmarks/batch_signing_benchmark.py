@@ -0,0 +1,46 @@
+import logging
+import time
+from Models.blockchain_application import BlockChainApplication
+
+# Usage (from the Code/ directory):
+#   python -m Benchmarks.batch_signing_benchmark
+
+WALLETS = 100
+TRANSACTIONS = 2000
+
+
+def main() -> None:
+    """Compare one-by-one and batch transaction creation throughput."""
+    logging.disable(logging.INFO)
+    app = BlockChainApplication()
+    names = [f"wallet-{i}" for i in range(WALLETS)]
+    app.create_wallets(names)
+
+    transfers = [
+        (names[i % WALLETS], names[(i + 1) % WALLETS], i + 1)
+        for i in range(TRANSACTIONS)
+    ]
+
+    start = time.perf_counter()
+    for sender, recipient, amount in transfers:
+        app.create_transaction(sender, recipient, amount)
+    sequential = TRANSACTIONS / (time.perf_counter() - start)
+
+    app.transaction_pool.clear()
+    start = time.perf_counter()
+    report = app.create_transactions(
+        [
+            (sender, recipient, amount + TRANSACTIONS)
+            for sender, recipient, amount in transfers
+        ]
+    )
+    batch = report["added"] / (time.perf_counter() - start)
+
+    print("\n===== TRANSACTION CREATION (tx/s, including pool admission) =====")
+    print(f"one by one: {sequential:>10.0f}")
+    print(f"batch:      {batch:>10.0f}")
+    print(f"batch signing only: {report['signed_per_second']:.0f} signed tx/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import logging
+import time
+from typing import Callable
+from Utils.ecdsa_backends import available_backends, set_backend
+
+# Usage (from the Code/ directory):
+#   python -m Benchmarks.ecdsa_benchmark
+
+OPERATIONS = 200
+MESSAGE = b"0" * 128
+
+
+def throughput(operation: Callable[[], object]) -> float:
+    """Measure how many times per second an operation runs.
+
+    Args:
+        operation: The operation to time.
+
+    Returns:
+        float: Operations per second.
+    """
+    start = time.perf_counter()
+    for _ in range(OPERATIONS):
+        operation()
+    return OPERATIONS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Print the throughput of each available backend."""
+    logging.disable(logging.INFO)
+    backends = [set_backend(name) for name in available_backends()]
+
+    print("\n===== ECDSA THROUGHPUT (ops/s) =====")
+    print(f"{'backend':>14} {'keygen':>10} {'sign':>10} {'verify':>10}")
+    for backend in backends:
+        private_key = backend.generate_private_key()
+        signing_key = backend.load_private_key(private_key)
+        verifying_key = backend.load_public_key(backend.get_public_key(private_key))
+        signature = backend.sign(signing_key, MESSAGE)
+
+        keygen = throughput(backend.generate_private_key)
+        sign = throughput(lambda: backend.sign(signing_key, MESSAGE))
+        verify = throughput(lambda: backend.verify(verifying_key, signature, MESSAGE))
+        print(f"{backend.name:>14} {keygen:>10.0f} {sign:>10.0f} {verify:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
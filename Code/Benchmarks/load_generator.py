@@ -0,0 +1,286 @@
+import argparse
+import itertools
+import logging
+import random
+import statistics
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from Models.blockchain_application import BlockChainApplication
+
+# Usage (from the Code/ directory):
+#   python -m Benchmarks.load_generator --wallets 100 --rate 200 --duration 10
+
+
+class LoadGenerator:
+    def __init__(
+        self,
+        app: BlockChainApplication,
+        wallets: int = 100,
+        rate: float = 100,
+        arrival: str = "poisson",
+        senders: str = "uniform",
+        difficulty: int = 2,
+        block_size: int = 100,
+        processes: int = 1,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize a load generator driving an application in process.
+
+        Args:
+            app: The application under load.
+            wallets: Number of simulated wallets.
+            rate: Target submission rate in transactions per second.
+            arrival: "constant" or "poisson" spacing between submissions.
+            senders: "uniform" or "zipf" choice of the sending wallet.
+            difficulty: Mining difficulty.
+            block_size: Maximum number of transactions per block.
+            processes: Worker processes used to sign each submitted batch.
+            seed: Seed of the random generator, for reproducible runs.
+
+        Raises:
+            ValueError: If the rate is not positive or a distribution is unknown.
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive: {rate}")
+        if arrival not in ("constant", "poisson"):
+            raise ValueError(f"Unknown arrival distribution: {arrival}")
+        if senders not in ("uniform", "zipf"):
+            raise ValueError(f"Unknown sender distribution: {senders}")
+
+        self.app = app
+        self.rate = rate
+        self.arrival = arrival
+        self.senders = senders
+        self.block_size = block_size
+        self.processes = processes
+        self.random = random.Random(seed)
+
+        self.app.adjust_difficulty(difficulty)
+        self.names = [f"load-{i}" for i in range(wallets)]
+        missing = [name for name in self.names if name not in self.app.keystore]
+        if missing:
+            self.app.create_wallets(missing)
+
+        # Zipf weights: the k-th wallet sends proportionally to 1 / k
+        self.sender_weights = list(
+            itertools.accumulate(1 / (rank + 1) for rank in range(wallets))
+        )
+
+    def _next_interval(self) -> float:
+        """Draw the time until the next submission."""
+        if self.arrival == "poisson":
+            return self.random.expovariate(self.rate)
+        return 1 / self.rate
+
+    def _next_transfer(self) -> Tuple[str, str, float]:
+        """Draw a (sender, recipient, amount) transfer."""
+        if self.senders == "zipf":
+            sender = self.random.choices(self.names, cum_weights=self.sender_weights)[0]
+        else:
+            sender = self.random.choice(self.names)
+
+        recipient = self.random.choice(self.names)
+        while recipient == sender and len(self.names) > 1:
+            recipient = self.random.choice(self.names)
+
+        return sender, recipient, round(self.random.uniform(1, 100), 2)
+
+    def run(self, duration: float, drain: bool = True) -> Dict:
+        """Submit transactions for `duration` seconds while a miner thread mines.
+
+        The calling thread submits, as one batch, every transaction whose
+        scheduled time has passed. A separate thread mines blocks continuously
+        from the transaction pool, which is safe to share between them. Latency
+        is measured from the scheduled submission time, so time spent waiting
+        for a block is counted.
+
+        Args:
+            duration: Length of the submission phase in seconds.
+            drain: Keep mining after the submission phase until the pool is empty.
+
+        Returns:
+            Dict: Counts, throughput, latency percentiles and pool depth samples.
+
+        Raises:
+            ValueError: If the duration is not positive.
+        """
+        if duration <= 0:
+            raise ValueError(f"Duration must be positive: {duration}")
+
+        pool = self.app.transaction_pool
+        scheduled: Dict[str, float] = {}
+        # (time mined, hashes of the block's transactions) for each block
+        mined: List[Tuple[float, List[str]]] = []
+        pool_depth: List[Tuple[float, int]] = []
+        miner_errors: List[Exception] = []
+        submitting = threading.Event()
+        submitting.set()
+
+        def mine() -> None:
+            try:
+                while submitting.is_set() or (drain and pool.size()):
+                    depth = pool.size()
+                    if not depth:
+                        time.sleep(0.001)
+                        continue
+
+                    # Sampled before mining, when the backlog is at its largest
+                    pool_depth.append((time.perf_counter() - start, depth))
+                    if self.app.mine_block(max_transactions=self.block_size):
+                        block = self.app.blockchain.get_latest_block()
+                        mined.append(
+                            (
+                                time.perf_counter() - start,
+                                block.get_transaction_hashes(),
+                            )
+                        )
+            except Exception as e:
+                miner_errors.append(e)
+
+        submitted = rejected = 0
+        miner = threading.Thread(target=mine)
+        start = time.perf_counter()
+        miner.start()
+        try:
+            next_submission = 0.0
+            while True:
+                now = time.perf_counter() - start
+                if now >= duration or miner_errors:
+                    break
+
+                due_times, transfers = [], []
+                while next_submission <= now:
+                    due_times.append(next_submission)
+                    transfers.append(self._next_transfer())
+                    next_submission += self._next_interval()
+
+                if not transfers:
+                    time.sleep(min(next_submission, duration) - now)
+                    continue
+
+                report = self.app.create_transactions(
+                    transfers, processes=self.processes
+                )
+                for due_time, result in zip(due_times, report["results"]):
+                    if result["added"]:
+                        scheduled[result["transaction"].transaction_hash] = due_time
+                        submitted += 1
+                    else:
+                        rejected += 1
+        finally:
+            submitting.clear()
+            miner.join()
+
+        if miner_errors:
+            raise miner_errors[0]
+
+        elapsed = time.perf_counter() - start
+        # Matched once both threads are done, as a block can be mined before
+        # create_transactions returns the hashes it contains
+        latencies = [
+            mined_at - scheduled.pop(transaction_hash)
+            for mined_at, transaction_hashes in mined
+            for transaction_hash in transaction_hashes
+            if transaction_hash in scheduled
+        ]
+
+        return {
+            "duration": elapsed,
+            "submitted": submitted,
+            "rejected": rejected,
+            "confirmed": len(latencies),
+            "unconfirmed": len(scheduled),
+            "blocks": len(mined),
+            "submit_rate": submitted / min(elapsed, duration),
+            "tps": len(latencies) / elapsed,
+            "latency": self._percentiles(latencies),
+            "pool_depth": pool_depth,
+        }
+
+    @staticmethod
+    def _percentiles(latencies: List[float]) -> Dict[str, float]:
+        """Summarize latencies in seconds."""
+        if not latencies:
+            return {}
+
+        # quantiles needs two data points, a single one is every percentile
+        cut_points = (
+            statistics.quantiles(latencies, n=100, method="inclusive")
+            if len(latencies) > 1
+            else latencies * 99
+        )
+        return {
+            "p50": cut_points[49],
+            "p90": cut_points[89],
+            "p99": cut_points[98],
+            "max": max(latencies),
+        }
+
+
+def print_report(report: Dict, samples: int = 10) -> None:
+    """Print a load generator report.
+
+    Args:
+        report: Dictionary returned by `LoadGenerator.run`.
+        samples: Number of pool depth samples to show.
+    """
+    print("\n===== LOAD TEST =====")
+    print(f"duration:     {report['duration']:.2f} s")
+    print(f"submitted:    {report['submitted']} ({report['submit_rate']:.1f} tx/s)")
+    print(f"rejected:     {report['rejected']}")
+    print(f"confirmed:    {report['confirmed']} in {report['blocks']} blocks")
+    print(f"unconfirmed:  {report['unconfirmed']}")
+    print(f"throughput:   {report['tps']:.1f} tx/s")
+
+    print("\nSubmit-to-inclusion latency (ms):")
+    for name, value in report["latency"].items():
+        print(f"  {name:>4}: {value * 1000:>10.1f}")
+
+    depths = report["pool_depth"]
+    if depths:
+        print("\nPool depth over time:")
+        step = max(1, len(depths) // samples)
+        for elapsed, depth in depths[::step]:
+            print(f"  {elapsed:>7.2f} s: {depth}")
+        print(f"  max: {max(depth for _, depth in depths)}")
+
+
+def main() -> None:
+    """Parse the command line, run the load test and print the report."""
+    parser = argparse.ArgumentParser(description="Blockchain load generator")
+    parser.add_argument("--wallets", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=100, help="target tx/s")
+    parser.add_argument("--duration", type=float, default=10, help="seconds")
+    parser.add_argument("--arrival", choices=["constant", "poisson"], default="poisson")
+    parser.add_argument("--senders", choices=["uniform", "zipf"], default="uniform")
+    parser.add_argument("--difficulty", type=int, default=2)
+    parser.add_argument("--block-size", type=int, default=100)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--data-dir", help="run against a node persisted in this directory"
+    )
+    parser.add_argument(
+        "--no-drain", action="store_true", help="stop mining when submission stops"
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    app = BlockChainApplication(data_dir=args.data_dir)
+    generator = LoadGenerator(
+        app,
+        wallets=args.wallets,
+        rate=args.rate,
+        arrival=args.arrival,
+        senders=args.senders,
+        difficulty=args.difficulty,
+        block_size=args.block_size,
+        processes=args.processes,
+        seed=args.seed,
+    )
+    print_report(generator.run(args.duration, drain=not args.no_drain))
+
+
+if __name__ == "__main__":
+    main()
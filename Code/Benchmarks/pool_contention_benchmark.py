@@ -0,0 +1,104 @@
+import logging
+import sys
+import threading
+import time
+from typing import List, Type
+from Models.keystore import KeyStore
+from Models.transaction import Transaction
+from Models.transaction_batch import sign_transactions
+from Models.transaction_pool import TransactionPool
+
+# Usage (from the Code/ directory):
+#   python -m Benchmarks.pool_contention_benchmark
+
+WALLETS = 50
+TRANSACTIONS = 4000
+PRODUCER_COUNTS = [1, 2, 4, 8]
+BLOCK_SIZE = 100
+
+
+class GlobalLockPool(TransactionPool):
+    """Baseline holding one lock for the whole admission, verification included."""
+
+    def __init__(self):
+        super().__init__()
+        self._global_lock = threading.Lock()
+
+    def add_transaction(self, transaction: Transaction) -> bool:
+        with self._global_lock:
+            return super().add_transaction(transaction)
+
+
+def stress(
+    pool_class: Type[TransactionPool], transactions: List[Transaction], producers: int
+) -> float:
+    """Add transactions from several threads while a miner drains the pool.
+
+    Args:
+        pool_class: The pool implementation to exercise.
+        transactions: Signed transactions to submit, each exactly once.
+        producers: Number of producer threads.
+
+    Returns:
+        float: Admitted transactions per second.
+    """
+    pool = pool_class()
+    producing = threading.Event()
+    producing.set()
+
+    def produce(chunk: List[Transaction]) -> None:
+        for transaction in chunk:
+            pool.add_transaction(transaction)
+
+    def mine() -> None:
+        while producing.is_set() or pool.size():
+            selected = pool.get_pending_transactions(limit=BLOCK_SIZE)
+            if not selected:
+                time.sleep(0.001)
+                continue
+            pool.remove_transactions(selected)
+
+    chunks = [transactions[i::producers] for i in range(producers)]
+    threads = [threading.Thread(target=produce, args=(chunk,)) for chunk in chunks]
+    miner = threading.Thread(target=mine)
+
+    start = time.perf_counter()
+    miner.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    producing.clear()
+    miner.join()
+
+    return len(transactions) / elapsed
+
+
+def main() -> None:
+    """Print admission throughput per producer count, against a global lock."""
+    logging.disable(logging.INFO)
+    keystore = KeyStore()
+    names = [f"wallet-{i}" for i in range(WALLETS)]
+    keystore.generate_wallets(names)
+
+    requests = []
+    for i in range(TRANSACTIONS):
+        private_key_str, sender = keystore.get(names[i % WALLETS])
+        _, recipient = keystore.get(names[(i + 1) % WALLETS])
+        requests.append((private_key_str, sender, recipient, i + 1))
+    transactions = [transaction for transaction, _ in sign_transactions(requests)]
+
+    # Switch threads far more often than the default to surface races
+    sys.setswitchinterval(1e-5)
+
+    print("\n===== POOL CONTENTION (admitted tx/s, with a concurrent miner) =====")
+    print(f"{'producers':>10} {'pool':>10} {'global lock':>12}")
+    for producers in PRODUCER_COUNTS:
+        pool_rate = stress(TransactionPool, transactions, producers)
+        global_rate = stress(GlobalLockPool, transactions, producers)
+        print(f"{producers:>10} {pool_rate:>10.0f} {global_rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import logging
+import time
+from typing import List
+from Models.block import Block
+from Models.blockchain import BlockChain
+from Models.transaction import Transaction
+
+# Usage (from the Code/ directory):
+#   python -m Benchmarks.reorg_benchmark
+
+DIFFICULTY = 1
+CHAIN_LENGTHS = [100, 1000]
+REORG_DEPTHS = [1, 4, 16, 64]
+
+
+def build_branch(
+    blockchain: BlockChain, parent: Block, length: int, label: str
+) -> List[Block]:
+    """Mine a branch of blocks on top of `parent` without adding them to the tree.
+
+    Args:
+        blockchain: The blockchain the branch is built for.
+        parent: The block the branch starts from.
+        length: Number of blocks to mine.
+        label: Prefix used to make the coinbase recipients of the branch unique.
+
+    Returns:
+        List[Block]: The mined blocks, from the parent's child to the branch tip.
+    """
+    branch = []
+    for i in range(length):
+        coinbase = Transaction(
+            sender="network", recipient=f"{label}-miner-{i}", amount=10
+        )
+        block = Block(
+            index=parent.index + 1,
+            previous_hash=parent.hash,
+            transactions=[coinbase],
+        )
+        block.mine_block(blockchain.difficulty)
+        branch.append(block)
+        parent = block
+
+    return branch
+
+
+def benchmark_reorg(chain_length: int, depth: int) -> float:
+    """Measure the time needed to switch to a heavier branch.
+
+    Args:
+        chain_length: Number of blocks on the best branch before the fork.
+        depth: Number of blocks of the best branch that the reorganization undoes.
+
+    Returns:
+        float: Duration of the reorganization in milliseconds.
+    """
+    blockchain = BlockChain(difficulty=DIFFICULTY)
+    for block in build_branch(
+        blockchain, blockchain.get_latest_block(), chain_length, "main"
+    ):
+        blockchain.receive_block(block)
+
+    fork_point = blockchain.chain[-depth - 1]
+    fork = build_branch(blockchain, fork_point, depth + 1, "fork")
+
+    # Everything but the last block leaves the fork lighter than the best branch
+    for block in fork[:-1]:
+        blockchain.receive_block(block)
+
+    start = time.perf_counter()
+    blockchain.receive_block(fork[-1])
+    elapsed = time.perf_counter() - start
+
+    assert blockchain.get_latest_block().hash == fork[-1].hash
+    return elapsed * 1000
+
+
+def main() -> None:
+    """Run the reorganization benchmark and print the results."""
+    logging.disable(logging.INFO)
+
+    print("\n===== REORG LATENCY =====")
+    print(f"{'chain length':>12} {'depth':>6} {'latency (ms)':>14}")
+    for chain_length in CHAIN_LENGTHS:
+        for depth in REORG_DEPTHS:
+            latency = benchmark_reorg(chain_length, depth)
+            print(f"{chain_length:>12} {depth:>6} {latency:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+# Usage (from the Code/ directory):
+#   python -m Benchmarks.startup_benchmark
+
+RUNS = 10
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIRST_COMMAND_PATTERN = re.compile(r"time to first command\s+([\d.]+) ms")
+
+
+def measure_startup() -> tuple:
+    """Start main.py, exit from the menu and time it.
+
+    Returns:
+        tuple: (time to first command, total wall time) in milliseconds.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "main.py", "--profile-startup"],
+        cwd=CODE_DIR,
+        input="7\n",
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_time = (time.perf_counter() - start) * 1000
+
+    match = FIRST_COMMAND_PATTERN.search(result.stdout)
+    return float(match.group(1)), wall_time
+
+
+def main() -> None:
+    """Run the startup benchmark and print the median timings."""
+    samples = [measure_startup() for _ in range(RUNS)]
+
+    print("\n===== STARTUP TIME =====")
+    print(f"runs: {RUNS}")
+    print(
+        f"time to first command (in process): "
+        f"{statistics.median(s[0] for s in samples):.1f} ms"
+    )
+    print(
+        f"process start to exit (wall time):  "
+        f"{statistics.median(s[1] for s in samples):.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,8 @@
 import logging
-from turtledemo.sorting_animate import Block
 from typing import List, Optional, Dict
 from Models.transaction import Transaction
 from Utils.crypto_utils import generate_hash, get_timestamp
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,  # Set log level to INFO
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
 
 class Block:
     def __init__(
@@ -19,6 +12,7 @@ class Block:
         transactions: List[Transaction],
         timestamp: Optional[int] = None,
         nonce: int = 0,
+        difficulty: int = 0,
     ) -> None:
         """Initialize a new block.
 
@@ -28,13 +22,17 @@ class Block:
             transactions: List of transactions to include in this block
             timestamp: Optional timestamp (will be generated if not provided)
             nonce: Value used for mining (proof-of-work)
+            difficulty: Number of leading zeros the block hash commits to
         """
         logging.info("Initializing a new block with index %d", index)
         self.index = index
         self.timestamp = timestamp if timestamp else get_timestamp()
         self.previous_hash = previous_hash
         self.transactions = transactions
+        # Only set once the transaction bodies have been pruned
+        self.transaction_hashes: Optional[List[str]] = None
         self.nonce = nonce
+        self.difficulty = difficulty
         self.hash = self._calculate_hash()
         logging.info("Block initialized with hash: %s", self.hash)
 
@@ -49,12 +47,40 @@ class Block:
             "index": self.index,
             "timestamp": self.timestamp,
             "previous_hash": self.previous_hash,
-            "transactions": [tx.transaction_hash for tx in self.transactions],
+            "transactions": self.get_transaction_hashes(),
             "nonce": self.nonce,
+            "difficulty": self.difficulty,
         }
 
         return generate_hash(block_header)
 
+    def get_transaction_hashes(self) -> List[str]:
+        """Get the hashes of the transactions committed to by the block.
+
+        Returns:
+            List[str]: The transaction hashes, available even after pruning.
+        """
+        if self.transaction_hashes is not None:
+            return self.transaction_hashes
+        return [tx.transaction_hash for tx in self.transactions]
+
+    def is_pruned(self) -> bool:
+        """Check whether the transaction bodies of the block have been dropped.
+
+        Returns:
+            bool: True if the block only keeps its header, False otherwise.
+        """
+        return self.transaction_hashes is not None
+
+    def prune(self) -> None:
+        """Drop the transaction bodies, keeping the header and its hash intact."""
+        if self.is_pruned():
+            return
+
+        logging.debug("Pruning transactions of block with index %d", self.index)
+        self.transaction_hashes = self.get_transaction_hashes()
+        self.transactions = []
+
     def mine_block(self, difficulty: int) -> None:
         """Perform proof-of-work to mine the block.
 
@@ -63,6 +89,8 @@ class Block:
         """
         logging.info("Mining block with index %d", self.index)
         target = "0" * difficulty
+        self.difficulty = difficulty
+        self.hash = self._calculate_hash()
 
         while self.hash[:difficulty] != target:
             self.nonce += 1
@@ -70,6 +98,26 @@ class Block:
 
         logging.info("Block mined successfully with hash: %s", self.hash)
 
+    def has_valid_proof_of_work(self) -> bool:
+        """Check that the block hash is consistent and meets its difficulty.
+
+        Returns:
+            bool: True if the proof-of-work is valid, False otherwise.
+        """
+        logging.debug("Checking proof-of-work for block with index %d", self.index)
+        return (
+            self.hash == self._calculate_hash()
+            and self.hash[: self.difficulty] == "0" * self.difficulty
+        )
+
+    def get_work(self) -> int:
+        """Get the expected number of hashes needed to mine this block.
+
+        Returns:
+            int: The amount of work represented by the block's difficulty.
+        """
+        return 16**self.difficulty
+
     def has_valid_transactions(self) -> bool:
         """Check if all transactions in the block are valid.
 
@@ -86,16 +134,21 @@ class Block:
             dict: A dictionary representation of the block.
         """
         logging.debug("Converting block with index %d to dictionary", self.index)
-        return {
+        data = {
             "index": self.index,
             "timestamp": self.timestamp,
             "previous_hash": self.previous_hash,
             "hash": self.hash,
             "nonce": self.nonce,
+            "difficulty": self.difficulty,
             "transactions": [
                 transaction.to_dict() for transaction in self.transactions
             ],
         }
+        if self.is_pruned():
+            data["transaction_hashes"] = self.transaction_hashes
+
+        return data
 
     def __str__(self) -> str:
         """Generate a string representation of the block.
@@ -106,7 +159,7 @@ class Block:
         logging.debug(
             "Generating string representation for block with index %d", self.index
         )
-        return f"Block #{self.index} [Hash: {self.hash[:10]}..., Number of Transactions: {len(self.transactions)}]"
+        return f"Block #{self.index} [Hash: {self.hash[:10]}..., Number of Transactions: {len(self.get_transaction_hashes())}]"
 
     @classmethod
     def from_dict(cls, data: Dict) -> "Block":
@@ -129,7 +182,9 @@ class Block:
             transactions=transactions,
             timestamp=data["timestamp"],
             nonce=data["nonce"],
+            difficulty=data.get("difficulty", 0),
         )
+        block.transaction_hashes = data.get("transaction_hashes")
         block.hash = data["hash"]
         logging.info("Block created from dictionary with index %d", block.index)
         return block
@@ -1,27 +1,49 @@
 import logging
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Set
 from Models.block import Block
 from Models.transaction import Transaction
 from Utils.crypto_constants import CryptoConstants
 from Utils.crypto_utils import get_timestamp
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,  # Set log level to INFO
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
 
 class BlockChain:
-    def __init__(self, difficulty: int = 2):
+    def __init__(self, difficulty: int = 2, prune_depth: Optional[int] = None):
         """Initialize the blockchain with a genesis block.
 
+        The blockchain keeps every known block in a tree indexed by hash and
+        follows the branch with the most cumulative work. `chain` always holds
+        the blocks of that best branch, from the root block to the tip. The root
+        is the genesis block, or the snapshot tip when started from a snapshot.
+
         Args:
             difficulty: The mining difficulty level (default is 2).
+            prune_depth: Drop transaction bodies of best-branch blocks deeper
+                than this many blocks below the tip (default keeps everything).
+                The tip itself is never pruned, so it must be at least 1.
+
+        Raises:
+            ValueError: If `prune_depth` is lower than 1.
         """
+        if prune_depth is not None and prune_depth < 1:
+            raise ValueError("Prune depth must be at least 1")
+
         logging.info("Initializing blockchain with difficulty %d", difficulty)
         self.chain: List[Block] = []
         self.difficulty = difficulty
+        self.prune_depth = prune_depth
+        self.base_height = 0
+        self.pruned_height = -1
+
+        # Block tree: every known block, its height and the work up to it
+        self.blocks: Dict[str, Block] = {}
+        self.heights: Dict[str, int] = {}
+        self.cumulative_work: Dict[str, int] = {}
+        self.invalid_blocks: Set[str] = set()
+
+        # State derived from the best branch, with the data to undo each block
+        self.balances: Dict[str, float] = {}
+        self.seen_transactions: Set[str] = set()
+        self.undo_data: Dict[str, Dict] = {}
 
         self._create_genesis_block()
 
@@ -42,9 +64,34 @@ class BlockChain:
             timestamp=get_timestamp(),
         )
 
-        self.chain.append(genesis_block)
+        self._set_root_block(genesis_block)
+        self._connect_block(genesis_block)
         logging.info("Genesis block created with hash: %s", genesis_block.hash)
 
+    def _set_root_block(
+        self, root_block: Block, height: int = 0, cumulative_work: Optional[int] = None
+    ) -> None:
+        """Reset the block tree and derived state to start from a root block.
+
+        Args:
+            root_block: The block to use as the root of the tree.
+            height: Height of the root block.
+            cumulative_work: Work up to the root block (default is its own work).
+        """
+        if cumulative_work is None:
+            cumulative_work = root_block.get_work()
+
+        self.chain = []
+        self.base_height = height
+        self.pruned_height = height - 1
+        self.blocks = {root_block.hash: root_block}
+        self.heights = {root_block.hash: height}
+        self.cumulative_work = {root_block.hash: cumulative_work}
+        self.invalid_blocks = set()
+        self.balances = {}
+        self.seen_transactions = set()
+        self.undo_data = {}
+
     def get_latest_block(self) -> Block:
         """Get the latest block in the blockchain.
 
@@ -54,27 +101,69 @@ class BlockChain:
         logging.debug("Fetching the latest block in the chain.")
         return self.chain[-1]
 
-    def add_block(self, transactions: List[Transaction]) -> Block:
-        """Add a new block to the blockchain.
+    def get_height(self) -> int:
+        """Get the height of the tip of the best branch.
+
+        Returns:
+            int: The height of the latest block.
+        """
+        return self.base_height + len(self.chain) - 1
+
+    def has_transaction(self, transaction_hash: str) -> bool:
+        """Check whether a transaction is already on the best branch.
+
+        Args:
+            transaction_hash: Hash of the transaction.
+
+        Returns:
+            bool: True if the transaction is on the best branch.
+        """
+        return transaction_hash in self.seen_transactions
+
+    def get_balance(self, address: str) -> float:
+        """Get the balance of an address on the best branch.
+
+        Args:
+            address: Public key (address) to look up.
+
+        Returns:
+            float: The balance of the address.
+        """
+        return self.balances.get(address, 0)
+
+    def add_block(
+        self, transactions: List[Transaction], previous_hash: Optional[str] = None
+    ) -> Block:
+        """Mine a new block and add it to the block tree.
 
         Args:
             transactions: List of transactions to include in the new block.
+            previous_hash: Hash of the parent block (default is the current tip).
 
         Returns:
             Block: The newly added block.
+
+        Raises:
+            ValueError: If the parent is unknown or the block is rejected.
         """
         logging.info("Adding a new block to the blockchain.")
-        previous_block = self.get_latest_block()
+        if previous_hash is None:
+            previous_hash = self.get_latest_block().hash
+
+        if previous_hash not in self.blocks:
+            raise ValueError(f"Unknown parent block: {previous_hash}")
 
         new_block = Block(
-            index=len(self.chain) + 1,
-            previous_hash=previous_block.hash,
+            index=self.heights[previous_hash] + 1,
+            previous_hash=previous_hash,
             transactions=transactions,
         )
 
         new_block.mine_block(self.difficulty)
 
-        self.chain.append(new_block)
+        if not self.receive_block(new_block):
+            raise ValueError(f"Block {new_block.hash} was rejected")
+
         logging.info(
             "New block added with index %d and hash: %s",
             new_block.index,
@@ -83,6 +172,235 @@ class BlockChain:
 
         return new_block
 
+    def receive_block(self, block: Block, min_difficulty: Optional[int] = None) -> bool:
+        """Insert a block into the block tree and switch to its branch if heavier.
+
+        Args:
+            block: The block to insert. Its parent must already be known.
+            min_difficulty: Lowest difficulty the block may commit to (default
+                is the current difficulty). Its proof-of-work is always checked
+                against the difficulty the block itself commits to.
+
+        Returns:
+            bool: True if the block was accepted into the tree, False otherwise.
+        """
+        logging.info("Receiving block with hash: %s", block.hash)
+        if block.hash in self.blocks:
+            logging.warning("Block is already known.")
+            return False
+
+        if (
+            block.previous_hash not in self.cumulative_work
+            or block.previous_hash in self.invalid_blocks
+        ):
+            logging.warning("Block parent is unknown or invalid.")
+            return False
+
+        if block.is_pruned():
+            logging.warning("Block has no transaction bodies.")
+            return False
+
+        if min_difficulty is None:
+            min_difficulty = self.difficulty
+
+        if block.difficulty < min_difficulty or not block.has_valid_proof_of_work():
+            logging.warning("Block has an invalid proof-of-work.")
+            return False
+
+        if not block.has_valid_transactions():
+            logging.warning("Block has invalid transactions.")
+            return False
+
+        self.blocks[block.hash] = block
+        self.heights[block.hash] = self.heights[block.previous_hash] + 1
+        self.cumulative_work[block.hash] = (
+            self.cumulative_work[block.previous_hash] + block.get_work()
+        )
+
+        tip = self.get_latest_block()
+        if self.cumulative_work[block.hash] > self.cumulative_work[tip.hash]:
+            return self._reorganize(block)
+
+        logging.info("Block stored on a side branch.")
+        return True
+
+    def _is_on_best_chain(self, block_hash: str) -> bool:
+        """Check whether a known block belongs to the best branch.
+
+        Args:
+            block_hash: Hash of a block in the tree.
+
+        Returns:
+            bool: True if the block is part of `chain`.
+        """
+        position = self.heights[block_hash] - self.base_height
+        return (
+            0 <= position < len(self.chain) and self.chain[position].hash == block_hash
+        )
+
+    def _reorganize(self, new_tip: Block) -> bool:
+        """Switch the best branch to end at `new_tip`.
+
+        Only the blocks between the fork point and each tip are touched, so the
+        cost depends on the depth of the reorganization, not on the chain length.
+
+        Args:
+            new_tip: The tip of the heavier branch.
+
+        Returns:
+            bool: True if the switch succeeded, False if the new branch was invalid.
+        """
+        to_connect: List[Block] = []
+        block_hash = new_tip.hash
+        while True:
+            # Checked first, as discarded blocks no longer have a height
+            if block_hash in self.invalid_blocks:
+                logging.error("Branch builds on an invalid block: %s", block_hash)
+                self._discard_blocks(to_connect)
+                return False
+
+            if self._is_on_best_chain(block_hash):
+                break
+
+            to_connect.append(self.blocks[block_hash])
+            block_hash = self.blocks[block_hash].previous_hash
+        to_connect.reverse()
+
+        fork_height = self.heights[block_hash]
+        if fork_height < self.pruned_height:
+            logging.error(
+                "Cannot reorganize below pruned height %d.", self.pruned_height
+            )
+            self._discard_blocks(to_connect)
+            return False
+
+        disconnected: List[Block] = []
+        while self.get_height() > fork_height:
+            disconnected.append(self._disconnect_tip())
+
+        if disconnected:
+            logging.info(
+                "Reorganizing: %d block(s) disconnected at height %d.",
+                len(disconnected),
+                fork_height,
+            )
+
+        for position, block in enumerate(to_connect):
+            if block.hash in self.invalid_blocks or not self._connect_block(block):
+                logging.error("Reorganization failed at block: %s", block.hash)
+                self._discard_blocks(to_connect[position:])
+                while self.get_height() > fork_height:
+                    self._disconnect_tip()
+                for old_block in reversed(disconnected):
+                    self._connect_block(old_block)
+                return False
+
+        self._prune()
+        return True
+
+    def _prune(self) -> None:
+        """Drop transaction bodies and undo data of blocks beyond the prune depth.
+
+        Reorganizations cannot go below the pruned height afterwards.
+        """
+        if self.prune_depth is None:
+            return
+
+        target_height = self.get_height() - self.prune_depth
+        while self.pruned_height < target_height:
+            self.pruned_height += 1
+            block = self.chain[self.pruned_height - self.base_height]
+            block.prune()
+            self.undo_data.pop(block.hash, None)
+
+    def _discard_blocks(self, blocks: List[Block]) -> None:
+        """Mark blocks and their stored descendants as invalid and drop them.
+
+        Only their hashes are kept, so that no branch built on them is selected.
+
+        Args:
+            blocks: The blocks to discard.
+        """
+        discarded = {block.hash for block in blocks}
+        # Parents sort before their children, so one pass finds every descendant
+        for block_hash in sorted(self.blocks, key=self.heights.__getitem__):
+            if self.blocks[block_hash].previous_hash in discarded:
+                discarded.add(block_hash)
+
+        for block_hash in discarded:
+            self.invalid_blocks.add(block_hash)
+            self.cumulative_work.pop(block_hash, None)
+            self.blocks.pop(block_hash, None)
+            self.heights.pop(block_hash, None)
+
+    def _connect_block(self, block: Block) -> bool:
+        """Apply a block to the derived state and append it to the best branch.
+
+        Args:
+            block: The block to connect. Its parent must be the current tip.
+
+        Returns:
+            bool: True if the block was connected, False if it spends a
+            transaction that is already on the best branch.
+        """
+        undo = {"balances": {}, "transactions": []}
+
+        for transaction in block.transactions:
+            if transaction.sender != "network":
+                if transaction.transaction_hash in self.seen_transactions:
+                    logging.warning(
+                        "Transaction already on chain: %s",
+                        transaction.transaction_hash,
+                    )
+                    self._apply_undo(undo)
+                    return False
+
+                self.seen_transactions.add(transaction.transaction_hash)
+                undo["transactions"].append(transaction.transaction_hash)
+                self._update_balance(undo, transaction.sender, -transaction.amount)
+
+            self._update_balance(undo, transaction.recipient, transaction.amount)
+
+        self.undo_data[block.hash] = undo
+        self.chain.append(block)
+        return True
+
+    def _disconnect_tip(self) -> Block:
+        """Remove the tip from the best branch and revert its state changes.
+
+        Returns:
+            Block: The disconnected block.
+        """
+        block = self.chain.pop()
+        self._apply_undo(self.undo_data.pop(block.hash))
+        return block
+
+    def _update_balance(self, undo: Dict, address: str, delta: float) -> None:
+        """Change a balance, recording its previous value in the undo data.
+
+        Args:
+            undo: Undo record of the block being connected.
+            address: Address whose balance changes.
+            delta: Amount to add to the balance.
+        """
+        if address not in undo["balances"]:
+            undo["balances"][address] = self.balances.get(address)
+        self.balances[address] = self.balances.get(address, 0) + delta
+
+    def _apply_undo(self, undo: Dict) -> None:
+        """Revert the state changes described by an undo record.
+
+        Args:
+            undo: Undo record produced while connecting a block.
+        """
+        for address, previous_balance in undo["balances"].items():
+            if previous_balance is None:
+                self.balances.pop(address, None)
+            else:
+                self.balances[address] = previous_balance
+
+        self.seen_transactions.difference_update(undo["transactions"])
+
     def is_valid_chain(self) -> bool:
         """Validate the integrity of the blockchain.
 
@@ -141,17 +459,112 @@ class BlockChain:
 
         Returns:
             BlockChain: A new Blockchain instance.
+
+        Raises:
+            ValueError: If a block does not extend the previous one or has been
+                pruned (pruned chains are restored with `from_snapshot`).
         """
         logging.info("Creating blockchain from dictionary.")
         blockchain = cls(difficulty=data["difficulty"])
-        # Clear the default genesis block
-        blockchain.chain = []
 
-        # Add all blocks from the data
-        for block_data in data["chain"]:
-            blockchain.chain.append(Block.from_dict(block_data))
+        # Replace the default genesis block with the one from the data
+        blocks = [Block.from_dict(block_data) for block_data in data["chain"]]
+        blockchain._set_root_block(blocks[0])
+        blockchain._connect_block(blocks[0])
+
+        for block in blocks[1:]:
+            previous_hash = blockchain.get_latest_block().hash
+            if (
+                block.is_pruned()
+                or block.previous_hash != previous_hash
+                or not blockchain._connect_block(block)
+            ):
+                raise ValueError(f"Invalid block in chain data: {block.hash}")
+
+            blockchain.blocks[block.hash] = block
+            blockchain.heights[block.hash] = blockchain.heights[previous_hash] + 1
+            blockchain.cumulative_work[block.hash] = (
+                blockchain.cumulative_work[previous_hash] + block.get_work()
+            )
 
         logging.info(
             "Blockchain created from dictionary with %d blocks.", len(blockchain.chain)
         )
         return blockchain
+
+    def to_snapshot(self) -> Dict:
+        """Capture the state derived from the best branch.
+
+        Returns:
+            Dict: A snapshot of the tip, difficulty, balances and seen transactions.
+        """
+        logging.info("Creating snapshot at height %d.", self.get_height())
+        tip = self.get_latest_block()
+        tip_header = tip.to_dict()
+        tip_header["transactions"] = []
+        tip_header["transaction_hashes"] = tip.get_transaction_hashes()
+
+        return {
+            "tip_hash": tip.hash,
+            "height": self.get_height(),
+            "difficulty": self.difficulty,
+            "cumulative_work": self.cumulative_work[tip.hash],
+            "tip": tip_header,
+            "balances": dict(self.balances),
+            "seen_transactions": sorted(self.seen_transactions),
+        }
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot: Dict,
+        blocks: Iterable[Block] = (),
+        prune_depth: Optional[int] = None,
+    ) -> "BlockChain":
+        """Create a Blockchain instance from a snapshot and replay later blocks.
+
+        Blocks at or below the snapshot height are skipped, so the whole block
+        log can be passed in. Replayed blocks were accepted before, possibly at
+        another difficulty, so each one is checked against its own difficulty.
+
+        Args:
+            snapshot: Dictionary produced by `to_snapshot`.
+            blocks: Blocks received after the snapshot, parents first.
+            prune_depth: Prune depth of the new blockchain.
+
+        Returns:
+            BlockChain: A new Blockchain instance whose root is the snapshot tip.
+
+        Raises:
+            ValueError: If the snapshot tip is corrupted or a block after the
+                snapshot cannot be replayed.
+        """
+        logging.info(
+            "Creating blockchain from snapshot at height %d.", snapshot["height"]
+        )
+        blockchain = cls(difficulty=snapshot["difficulty"], prune_depth=prune_depth)
+
+        tip = Block.from_dict(snapshot["tip"])
+        if (
+            tip.hash != snapshot["tip_hash"]
+            or tip._calculate_hash() != snapshot["tip_hash"]
+        ):
+            raise ValueError("Snapshot tip does not match its hash")
+
+        blockchain._set_root_block(
+            tip, height=snapshot["height"], cumulative_work=snapshot["cumulative_work"]
+        )
+        blockchain.balances = dict(snapshot["balances"])
+        blockchain.seen_transactions = set(snapshot["seen_transactions"])
+        blockchain.chain.append(tip)
+
+        replayed = 0
+        for block in blocks:
+            if block.index <= snapshot["height"] or block.hash in blockchain.blocks:
+                continue
+            if not blockchain.receive_block(block, min_difficulty=0):
+                raise ValueError(f"Block {block.hash} after the snapshot was rejected")
+            replayed += 1
+
+        logging.info("Replayed %d block(s) after the snapshot.", replayed)
+        return blockchain
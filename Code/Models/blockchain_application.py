@@ -1,28 +1,78 @@
-from typing import Dict, Tuple
+import os
+import time
+from typing import Dict, List, Optional, Tuple
 from Models.blockchain import BlockChain
+from Models.chain_store import ChainStore
+from Models.keystore import KeyStore
 from Models.transaction import Transaction
+from Models.transaction_batch import sign_transactions
 from Models.transaction_pool import TransactionPool
-from Utils.crypto_utils import generate_keys_pairs
 
 
 class BlockChainApplication:
-    def __init__(self):
-        self.blockchain = BlockChain()
-        self.transaction_pool = TransactionPool()
-        self.wallets: Dict[str, Tuple[str, str]] = {}
+    def __init__(
+        self,
+        data_dir: Optional[str] = None,
+        snapshot_interval: int = 10,
+        prune_depth: Optional[int] = None,
+    ):
+        """Initialize the application.
 
-        if not self.wallets:
-            self._create_wallet("system")
+        Args:
+            data_dir: Directory where blocks, snapshots and wallets are persisted.
+                When set, the node restarts from the latest snapshot in it.
+            snapshot_interval: Number of blocks between two snapshots.
+            prune_depth: Drop transaction bodies deeper than this many blocks.
+        """
+        self.snapshot_interval = snapshot_interval
+        self.chain_store = ChainStore(data_dir) if data_dir else None
+        self.blockchain = self._load_blockchain(prune_depth)
+        self.transaction_pool = TransactionPool(
+            is_confirmed=lambda transaction_hash: self.blockchain.has_transaction(
+                transaction_hash
+            )
+        )
+        # The "system" (miner) wallet is created on first use to keep startup fast
+        self.keystore = KeyStore(
+            os.path.join(data_dir, "wallets.jsonl") if data_dir else None
+        )
+        self.wallets = self.keystore.wallets
+
+    def _load_blockchain(self, prune_depth: Optional[int]) -> BlockChain:
+        if self.chain_store is None:
+            return BlockChain(prune_depth=prune_depth)
+
+        snapshot = self.chain_store.load_snapshot()
+        if snapshot is None:
+            blockchain = BlockChain(prune_depth=prune_depth)
+            self.chain_store.save_snapshot(blockchain.to_snapshot())
+            return blockchain
+
+        return BlockChain.from_snapshot(
+            snapshot, self.chain_store.read_blocks(), prune_depth=prune_depth
+        )
 
     def _create_wallet(self, name: str) -> Tuple[str, str]:
-        private_key_str, public_key_str = generate_keys_pairs()
-        self.wallets[name] = (private_key_str, public_key_str)
-        return private_key_str, public_key_str
+        return self.keystore.create_wallet(name)
 
     def _get_wallet_by_name(self, name: str) -> Tuple[str, str]:
-        if name not in self.wallets:
+        if name not in self.keystore:
             return self._create_wallet(name)
-        return self.wallets[name]
+        return self.keystore.get(name)
+
+    def create_wallets(
+        self, names: List[str], processes: Optional[int] = None
+    ) -> List[Tuple[str, str]]:
+        """Create many wallets at once, generating keys across worker processes.
+
+        Args:
+            names: Names of the wallets to create.
+            processes: Number of worker processes (default is the CPU count).
+
+        Returns:
+            List[Tuple[str, str]]: (private_key_str, public_key_str) of each wallet.
+        """
+        return self.keystore.generate_wallets(names, processes=processes)
 
     def create_transaction(
         self, sender_name: str, recipient_name: str, amount: float
@@ -43,8 +93,97 @@ class BlockChainApplication:
         self.transaction_pool.add_transaction(transaction)
         return transaction
 
-    def mine_block(self, reward: float = 10) -> bool:
-        pending_transactions = self.transaction_pool.get_pending_transactions(limit=2)
+    def create_transactions(
+        self, transfers: List[Tuple[str, str, float]], processes: Optional[int] = None
+    ) -> Dict:
+        """Create, sign and submit many transactions at once.
+
+        Missing wallets are created in bulk, transactions are hashed and signed
+        across worker processes, and the pool admits them in a single call.
+
+        Args:
+            transfers: (sender name, recipient name, amount) tuples.
+            processes: Number of worker processes (default is the CPU count).
+
+        Returns:
+            Dict: Per-transfer results ("transaction", "added", "error") and the
+            signing throughput ("signed", "added", "seconds", "signed_per_second").
+            The error is the reason `Transaction` refused the transfer, or the
+            reason the pool refused the transaction (see `TransactionPool`).
+        """
+        names = {
+            name for sender, recipient, _ in transfers for name in (sender, recipient)
+        }
+        missing = sorted(name for name in names if name not in self.keystore)
+        if missing:
+            self.keystore.generate_wallets(missing, processes=processes)
+
+        requests = []
+        for sender_name, recipient_name, amount in transfers:
+            sender_private_key_str, sender_public_key_str = self.keystore.get(
+                sender_name
+            )
+            _, recipient_public_key_str = self.keystore.get(recipient_name)
+            requests.append(
+                (
+                    sender_private_key_str,
+                    sender_public_key_str,
+                    recipient_public_key_str,
+                    amount,
+                )
+            )
+
+        start = time.perf_counter()
+        signed = sign_transactions(requests, processes=processes)
+        seconds = time.perf_counter() - start
+
+        transactions = [transaction for transaction, _ in signed if transaction]
+        pool_errors = iter(self.transaction_pool.add_transactions(transactions))
+
+        results = []
+        for transaction, error in signed:
+            if transaction:
+                error = next(pool_errors)
+            results.append(
+                {
+                    "transaction": transaction,
+                    "added": transaction is not None and error is None,
+                    "error": error,
+                }
+            )
+
+        return {
+            "results": results,
+            "signed": len(transactions),
+            "added": sum(result["added"] for result in results),
+            "seconds": seconds,
+            "signed_per_second": len(transactions) / seconds if seconds else 0.0,
+        }
+
+    def adjust_difficulty(self, difficulty: int) -> None:
+        """Change the mining difficulty, persisting it in a new snapshot.
+
+        Args:
+            difficulty: The new difficulty level.
+        """
+        self.blockchain.adjust_difficulty(difficulty)
+        if self.chain_store is not None:
+            self.chain_store.save_snapshot(self.blockchain.to_snapshot())
+
+    def mine_block(self, reward: float = 10, max_transactions: int = 2) -> bool:
+        # Drop pending transactions that reached the chain since their admission
+        while True:
+            pending_transactions = self.transaction_pool.get_pending_transactions(
+                limit=max_transactions
+            )
+            confirmed = [
+                transaction
+                for transaction in pending_transactions
+                if self.blockchain.has_transaction(transaction.transaction_hash)
+            ]
+            if not confirmed:
+                break
+            self.transaction_pool.remove_transactions(confirmed)
 
         if not pending_transactions:
             return False
@@ -56,7 +195,12 @@ class BlockChainApplication:
 
         pending_transactions.insert(0, coinbase_transaction)
 
-        self.blockchain.add_block(pending_transactions)
+        block = self.blockchain.add_block(pending_transactions)
+
+        if self.chain_store is not None:
+            self.chain_store.append_block(block)
+            if self.blockchain.get_height() % self.snapshot_interval == 0:
+                self.chain_store.save_snapshot(self.blockchain.to_snapshot())
 
         self.transaction_pool.remove_transactions(pending_transactions)
 
@@ -101,7 +245,7 @@ class BlockChainApplication:
     def display_wallets(self) -> None:
         """Display the available wallets."""
         print("\n===== WALLETS =====")
-        for name, (_, public_key) in self.wallets.items():
+        for name, (_, public_key) in self.keystore.items():
             print(f"{name}: {public_key[:10]}...")
         print()
 
@@ -0,0 +1,102 @@
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+from Models.block import Block
+
+
+class ChainStore:
+    BLOCKS_FILE = "blocks.jsonl"
+    SNAPSHOT_FILE = "snapshot.json"
+
+    def __init__(self, directory: str) -> None:
+        """Initialize a store that persists blocks and snapshots in a directory.
+
+        Blocks are appended to a log, one JSON object per line. Writing a
+        snapshot drops the blocks it covers from the log, so a restart only
+        replays the blocks received after the latest snapshot.
+
+        Args:
+            directory: Directory holding the block log and the snapshot.
+        """
+        logging.info("Initializing chain store in %s", directory)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+        self.blocks_path = os.path.join(directory, self.BLOCKS_FILE)
+        self.snapshot_path = os.path.join(directory, self.SNAPSHOT_FILE)
+
+    def append_block(self, block: Block) -> None:
+        """Append a block to the block log.
+
+        Args:
+            block: The block to persist.
+        """
+        logging.debug("Appending block with index %d to the log.", block.index)
+        with open(self.blocks_path, "a") as blocks_file:
+            blocks_file.write(json.dumps(block.to_dict(), sort_keys=True) + "\n")
+
+    def read_blocks(self) -> List[Block]:
+        """Read every block of the block log.
+
+        Returns:
+            List[Block]: The logged blocks, in the order they were appended.
+        """
+        logging.info("Reading blocks from the log.")
+        if not os.path.exists(self.blocks_path):
+            return []
+
+        with open(self.blocks_path) as blocks_file:
+            return [
+                Block.from_dict(json.loads(line))
+                for line in blocks_file
+                if line.strip()
+            ]
+
+    def save_snapshot(self, snapshot: Dict) -> None:
+        """Write a snapshot and compact the block log.
+
+        Both files are written to a temporary path first and then renamed, so
+        an interrupted write leaves the previous state intact.
+
+        Args:
+            snapshot: Dictionary produced by `BlockChain.to_snapshot`.
+        """
+        logging.info("Saving snapshot at height %d.", snapshot["height"])
+        self._write_atomically(self.snapshot_path, json.dumps(snapshot, sort_keys=True))
+
+        remaining = [
+            block for block in self.read_blocks() if block.index > snapshot["height"]
+        ]
+        self._write_atomically(
+            self.blocks_path,
+            "".join(
+                json.dumps(block.to_dict(), sort_keys=True) + "\n"
+                for block in remaining
+            ),
+        )
+
+    def load_snapshot(self) -> Optional[Dict]:
+        """Load the latest snapshot.
+
+        Returns:
+            Optional[Dict]: The snapshot, or None if none has been written yet.
+        """
+        if not os.path.exists(self.snapshot_path):
+            return None
+
+        logging.info("Loading snapshot from %s", self.snapshot_path)
+        with open(self.snapshot_path) as snapshot_file:
+            return json.load(snapshot_file)
+
+    def _write_atomically(self, path: str, content: str) -> None:
+        """Replace the content of a file in a single rename.
+
+        Args:
+            path: File to replace.
+            content: New content of the file.
+        """
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "w") as temporary_file:
+            temporary_file.write(content)
+        os.replace(temporary_path, path)
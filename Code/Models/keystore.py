@@ -0,0 +1,181 @@
+import json
+import logging
+import os
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+from Utils.crypto_utils import generate_keys_pairs
+
+# Below this many wallets, spawning worker processes costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+
+def _generate_key_pairs(count: int) -> List[Tuple[str, str]]:
+    """Generate several key pairs (runs in a worker process).
+
+    Args:
+        count: Number of key pairs to generate.
+
+    Returns:
+        List[Tuple[str, str]]: (private_key_str, public_key_str) pairs in base64.
+    """
+    return [generate_keys_pairs() for _ in range(count)]
+
+
+class KeyStore:
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Initialize the keystore, loading the wallets saved at `path`.
+
+        Wallets are indexed by name and by public key (address). When a path is
+        given, new wallets are appended to it, one JSON object per line.
+
+        Args:
+            path: File where wallets are persisted (default keeps them in memory).
+        """
+        logging.info("Initializing keystore.")
+        self.path = path
+        self.wallets: Dict[str, Tuple[str, str]] = {}
+        self.names_by_public_key: Dict[str, str] = {}
+
+        if path and os.path.exists(path):
+            with open(path) as wallets_file:
+                for line in wallets_file:
+                    if line.strip():
+                        data = json.loads(line)
+                        self._index(
+                            data["name"], data["private_key"], data["public_key"]
+                        )
+
+            logging.info("Loaded %d wallet(s) from %s", len(self.wallets), path)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.wallets
+
+    def __len__(self) -> int:
+        return len(self.wallets)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.wallets)
+
+    def items(self):
+        """Iterate over (name, (private_key_str, public_key_str)) pairs."""
+        return self.wallets.items()
+
+    def get(self, name: str) -> Optional[Tuple[str, str]]:
+        """Get a wallet by name.
+
+        Args:
+            name: Name of the wallet.
+
+        Returns:
+            Optional[Tuple[str, str]]: (private_key_str, public_key_str), or None.
+        """
+        return self.wallets.get(name)
+
+    def get_name(self, public_key: str) -> Optional[str]:
+        """Find the name of the wallet owning an address.
+
+        Args:
+            public_key: Public key (address) of the wallet.
+
+        Returns:
+            Optional[str]: The wallet name, or None if the address is unknown.
+        """
+        return self.names_by_public_key.get(public_key)
+
+    def create_wallet(self, name: str) -> Tuple[str, str]:
+        """Generate and store a new wallet.
+
+        Args:
+            name: Name of the wallet.
+
+        Returns:
+            Tuple[str, str]: (private_key_str, public_key_str) in base64.
+        """
+        return self.generate_wallets([name])[0]
+
+    def generate_wallets(
+        self, names: List[str], processes: Optional[int] = None
+    ) -> List[Tuple[str, str]]:
+        """Generate and store new wallets, in parallel across worker processes.
+
+        Args:
+            names: Names of the wallets to create. Existing names are rejected.
+            processes: Number of worker processes (default is the CPU count).
+
+        Returns:
+            List[Tuple[str, str]]: The new key pairs, in the order of `names`.
+
+        Raises:
+            ValueError: If a name already exists or appears twice.
+        """
+        existing = [name for name in names if name in self.wallets]
+        repeated = sorted(name for name, count in Counter(names).items() if count > 1)
+        if existing or repeated:
+            raise ValueError(
+                f"Wallet names must be new and unique: {existing} already exist, "
+                f"{repeated} repeated"
+            )
+
+        logging.info("Generating %d wallet(s).", len(names))
+        processes = processes or os.cpu_count() or 1
+        if len(names) < PARALLEL_THRESHOLD or processes == 1:
+            key_pairs = _generate_key_pairs(len(names))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            chunk_size = -(-len(names) // processes)
+            chunks = [
+                min(chunk_size, len(names) - start)
+                for start in range(0, len(names), chunk_size)
+            ]
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                key_pairs = [
+                    key_pair
+                    for chunk in executor.map(_generate_key_pairs, chunks)
+                    for key_pair in chunk
+                ]
+
+        for name, (private_key_str, public_key_str) in zip(names, key_pairs):
+            self._index(name, private_key_str, public_key_str)
+        self._save(names)
+
+        return key_pairs
+
+    def _index(self, name: str, private_key_str: str, public_key_str: str) -> None:
+        """Add a wallet to the name and public key indexes.
+
+        Args:
+            name: Name of the wallet.
+            private_key_str: Private key in base64.
+            public_key_str: Public key in base64.
+        """
+        self.wallets[name] = (private_key_str, public_key_str)
+        self.names_by_public_key[public_key_str] = name
+
+    def _save(self, names: List[str]) -> None:
+        """Append wallets to the keystore file.
+
+        The file is created readable by its owner only, as it holds private keys.
+
+        Args:
+            names: Names of the wallets to append.
+        """
+        if not self.path:
+            return
+
+        descriptor = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        with os.fdopen(descriptor, "a") as wallets_file:
+            wallets_file.write(
+                "".join(
+                    json.dumps(
+                        {
+                            "name": name,
+                            "private_key": self.wallets[name][0],
+                            "public_key": self.wallets[name][1],
+                        },
+                        sort_keys=True,
+                    )
+                    + "\n"
+                    for name in names
+                )
+            )
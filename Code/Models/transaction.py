@@ -1,5 +1,5 @@
 from Utils.crypto_utils import *
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import logging
 
 
@@ -69,6 +69,41 @@ class Transaction:
 
         return verify_signature(self.transaction_hash, self.signature, self.sender)
 
+    @staticmethod
+    def validate_many(transactions: List["Transaction"]) -> List[bool]:
+        """Check the validity of several transactions at once.
+
+        Each distinct sender public key is parsed only once.
+
+        Args:
+            transactions: The transactions to check.
+
+        Returns:
+            List[bool]: Whether each transaction is valid, in order.
+        """
+        signed = [
+            transaction
+            for transaction in transactions
+            if transaction.sender != "network"
+        ]
+        signed_results = iter(
+            verify_signatures(
+                [
+                    (
+                        transaction.transaction_hash,
+                        transaction.signature,
+                        transaction.sender,
+                    )
+                    for transaction in signed
+                ]
+            )
+        )
+
+        return [
+            True if transaction.sender == "network" else next(signed_results)
+            for transaction in transactions
+        ]
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert the transaction object to a dictionary.
 
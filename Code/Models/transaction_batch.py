@@ -0,0 +1,109 @@
+import logging
+import os
+from typing import Dict, List, Optional, Tuple
+from Models.transaction import Transaction
+from Utils.crypto_utils import generate_signatures
+
+# Below this many transactions, spawning worker processes costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+# (position in the batch, sender public key, recipient public key, amount)
+TransactionRequest = Tuple[int, str, str, float]
+
+# (sender private key, requests signed with it)
+SenderGroup = Tuple[str, List[TransactionRequest]]
+
+# (position in the batch, signed transaction or None, error message or None)
+SigningResult = Tuple[int, Optional[Transaction], Optional[str]]
+
+
+def _sign_groups(groups: List[SenderGroup]) -> List[SigningResult]:
+    """Build, hash and sign the transactions of several senders.
+
+    Runs in a worker process. Each sender's private key is parsed once for
+    all of its transactions.
+
+    Args:
+        groups: Transaction requests grouped by sender private key.
+
+    Returns:
+        List[SigningResult]: One result per request.
+    """
+    results: List[SigningResult] = []
+    for private_key_str, requests in groups:
+        transactions = []
+        for position, sender, recipient, amount in requests:
+            try:
+                transaction = Transaction(
+                    sender=sender, recipient=recipient, amount=amount
+                )
+            except (TypeError, ValueError) as e:
+                results.append((position, None, str(e)))
+                continue
+            transactions.append((position, transaction))
+
+        signatures = generate_signatures(
+            [transaction.transaction_hash for _, transaction in transactions],
+            private_key_str,
+        )
+        for (position, transaction), signature in zip(transactions, signatures):
+            transaction.signature = signature
+            results.append((position, transaction, None))
+
+    return results
+
+
+def sign_transactions(
+    requests: List[Tuple[str, str, str, float]], processes: Optional[int] = None
+) -> List[Tuple[Optional[Transaction], Optional[str]]]:
+    """Create and sign many transactions, in parallel across worker processes.
+
+    Requests are grouped by sender so that each worker parses a sender's key
+    once, and the groups are spread over the workers by transaction count.
+
+    Args:
+        requests: (sender private key, sender public key, recipient public key,
+            amount) tuples, with keys in base64.
+        processes: Number of worker processes (default is the CPU count).
+
+    Returns:
+        List[Tuple[Optional[Transaction], Optional[str]]]: For each request, in
+        order, the signed transaction or the error that prevented creating it.
+    """
+    logging.info("Signing %d transactions.", len(requests))
+    groups: Dict[str, List[TransactionRequest]] = {}
+    for position, (private_key_str, sender, recipient, amount) in enumerate(requests):
+        groups.setdefault(private_key_str, []).append(
+            (position, sender, recipient, amount)
+        )
+
+    processes = processes or os.cpu_count() or 1
+    if len(requests) < PARALLEL_THRESHOLD or processes == 1:
+        results = _sign_groups(list(groups.items()))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Largest groups first, each to the currently lightest worker
+        buckets: List[List[SenderGroup]] = [[] for _ in range(processes)]
+        loads = [0] * processes
+        for group in sorted(groups.items(), key=lambda g: len(g[1]), reverse=True):
+            lightest = loads.index(min(loads))
+            buckets[lightest].append(group)
+            loads[lightest] += len(group[1])
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = [
+                result
+                for bucket_results in executor.map(
+                    _sign_groups, [bucket for bucket in buckets if bucket]
+                )
+                for result in bucket_results
+            ]
+
+    ordered: List[Tuple[Optional[Transaction], Optional[str]]] = [
+        (None, None) for _ in requests
+    ]
+    for position, transaction, error in results:
+        ordered[position] = (transaction, error)
+
+    return ordered
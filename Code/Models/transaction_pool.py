@@ -1,20 +1,43 @@
 import logging
-from typing import Dict, List, Set
+import threading
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Set
 from Models.transaction import Transaction
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,  # Set log level to INFO
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
+# Reasons a transaction is refused by the pool
+DUPLICATE = "Transaction is a duplicate"
+ALREADY_CONFIRMED = "Transaction is already on the chain"
+INVALID = "Transaction is invalid"
 
 
 class TransactionPool:
-    def __init__(self):
-        """Initialize the transaction pool."""
+    def __init__(self, is_confirmed: Optional[Callable[[str], bool]] = None):
+        """Initialize the transaction pool.
+
+        The pool is safe to use from several threads. Pending transactions are
+        kept in insertion order, keyed by hash, behind a lock that is only held
+        for dictionary updates and snapshots, never for signature verification.
+
+        Args:
+            is_confirmed: Optional check telling whether a transaction hash is
+                already on the chain. Such transactions are refused.
+        """
         logging.info("Initializing transaction pool.")
-        self.pending_transactions: List[Transaction] = []
-        self.transaction_hashes: Set[str] = set()
+        self.is_confirmed = is_confirmed
+        self._transactions: Dict[str, Transaction] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pending_transactions(self) -> List[Transaction]:
+        """Snapshot of the pending transactions, oldest first."""
+        with self._lock:
+            return list(self._transactions.values())
+
+    @property
+    def transaction_hashes(self) -> Set[str]:
+        """Snapshot of the hashes of the pending transactions."""
+        with self._lock:
+            return set(self._transactions)
 
     def add_transaction(self, transaction: Transaction) -> bool:
         """Add a transaction to the pool if it is valid and not a duplicate.
@@ -26,19 +49,69 @@ class TransactionPool:
             bool: True if the transaction was added, False otherwise.
         """
         logging.info("Adding transaction with hash: %s", transaction.transaction_hash)
+        # Unlocked pre-check to skip verifying known duplicates, repeated below
+        if transaction.transaction_hash in self._transactions:
+            logging.warning("Transaction is a duplicate.")
+            return False
+
+        if self.is_confirmed and self.is_confirmed(transaction.transaction_hash):
+            logging.warning("Transaction is already on the chain.")
+            return False
+
         if not transaction.is_valid():
             logging.warning("Transaction is invalid.")
             return False
 
-        if transaction.transaction_hash in self.transaction_hashes:
-            logging.warning("Transaction is a duplicate.")
-            return False
+        with self._lock:
+            if transaction.transaction_hash in self._transactions:
+                logging.warning("Transaction is a duplicate.")
+                return False
+
+            self._transactions[transaction.transaction_hash] = transaction
 
-        self.pending_transactions.append(transaction)
-        self.transaction_hashes.add(transaction.transaction_hash)
         logging.info("Transaction added successfully.")
         return True
 
+    def add_transactions(self, transactions: List[Transaction]) -> List[Optional[str]]:
+        """Add several transactions, verifying their signatures as one batch.
+
+        Args:
+            transactions: The transactions to add.
+
+        Returns:
+            List[Optional[str]]: For each transaction, in order, None if it was
+            added, otherwise why it was refused (DUPLICATE, ALREADY_CONFIRMED or
+            INVALID).
+        """
+        logging.info("Adding %d transactions.", len(transactions))
+        errors: List[Optional[str]] = [
+            None if is_valid else INVALID
+            for is_valid in Transaction.validate_many(transactions)
+        ]
+        if self.is_confirmed:
+            errors = [
+                (
+                    ALREADY_CONFIRMED
+                    if self.is_confirmed(transaction.transaction_hash)
+                    else error
+                )
+                for transaction, error in zip(transactions, errors)
+            ]
+
+        with self._lock:
+            for position, transaction in enumerate(transactions):
+                if errors[position]:
+                    continue
+
+                if transaction.transaction_hash in self._transactions:
+                    errors[position] = DUPLICATE
+                    continue
+
+                self._transactions[transaction.transaction_hash] = transaction
+
+        logging.info("%d transaction(s) added.", errors.count(None))
+        return errors
+
     def get_pending_transactions(self, limit: int = None) -> List[Transaction]:
         """Retrieve pending transactions from the pool.
 
@@ -49,10 +122,8 @@ class TransactionPool:
             List[Transaction]: A list of pending transactions.
         """
         logging.info("Fetching pending transactions with limit: %s", limit)
-        if limit is None or limit >= len(self.pending_transactions):
-            return self.pending_transactions.copy()
-
-        return self.pending_transactions[:limit]
+        with self._lock:
+            return list(islice(self._transactions.values(), limit))
 
     def remove_transactions(self, transactions: List[Transaction]) -> None:
         """Remove a list of transactions from the pool.
@@ -61,24 +132,18 @@ class TransactionPool:
             transactions: The transactions to remove.
         """
         logging.info("Removing transactions from the pool.")
-        transactions_hashes_to_remove = {
-            transaction.transaction_hash for transaction in transactions
-        }
+        # Only the given transactions are touched, so concurrent additions survive
+        with self._lock:
+            for transaction in transactions:
+                self._transactions.pop(transaction.transaction_hash, None)
 
-        self.pending_transactions = [
-            transaction
-            for transaction in self.pending_transactions
-            if transaction.transaction_hash not in transactions_hashes_to_remove
-        ]
-
-        self.transaction_hashes -= transactions_hashes_to_remove
         logging.info("Transactions removed successfully.")
 
     def clear(self) -> None:
         """Clear all transactions from the pool."""
         logging.info("Clearing all transactions from the pool.")
-        self.pending_transactions = []
-        self.transaction_hashes = set()
+        with self._lock:
+            self._transactions.clear()
         logging.info("Transaction pool cleared.")
 
     def size(self) -> int:
@@ -88,7 +153,7 @@ class TransactionPool:
             int: Number of pending transactions.
         """
         logging.debug("Getting the size of the transaction pool.")
-        return len(self.pending_transactions)
+        return len(self._transactions)
 
     def to_dict(self) -> Dict:
         """Convert the transaction pool to a dictionary.
@@ -117,12 +182,12 @@ class TransactionPool:
         pool = cls()
 
         # Add all transactions from the data
-        for tx_data in data["pending_transactions"]:
-            tx = Transaction.from_dict(tx_data)
-            pool.add_transaction(tx)
+        pool.add_transactions(
+            [Transaction.from_dict(tx_data) for tx_data in data["pending_transactions"]]
+        )
 
         logging.info(
             "Transaction pool created from dictionary with %d transactions.",
-            len(pool.pending_transactions),
+            pool.size(),
         )
         return pool
@@ -1,19 +1,10 @@
 import hashlib
-from typing import Any, Tuple
+from typing import Any, Dict, List, Tuple
 import logging
 from Utils.utils import *
 import time
-
-# Elliptic Curve Digital Signature Algorithm
-import ecdsa
 import base64
-
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,  # Set log level to INFO
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
+from Utils.ecdsa_backends import get_backend
 
 
 def generate_hash(data: Any) -> str:
@@ -44,12 +35,14 @@ def generate_keys_pairs() -> Tuple[str, str]:
         Tuple: (private_key_str, public_key_str) each one encoded in base64 (for readability)
     """
     logging.info("Generating ECDSA key pairs.")
+    # Elliptic Curve Digital Signature Algorithm backend, loaded on first use
+    backend = get_backend()
 
-    private_key = ecdsa.SigningKey.generate(curve=ecdsa.SECP256k1)
-    public_key: ecdsa.VerifyingKey = private_key.get_verifying_key()
+    private_key = backend.generate_private_key()
+    public_key = backend.get_public_key(private_key)
 
-    private_key_str = base64.b64encode(private_key.to_string()).decode()
-    public_key_str = base64.b64encode(public_key.to_string()).decode()
+    private_key_str = base64.b64encode(private_key).decode()
+    public_key_str = base64.b64encode(public_key).decode()
 
     logging.info("Key pair generation complete.")
     logging.debug("Private Key: %s", private_key_str)
@@ -73,14 +66,40 @@ def generate_signature(data: Any, private_key_str: str) -> str:
         data = dump_data(data)
         logging.debug("Data converted to JSON string: %s", data)
 
+    backend = get_backend()
+
     private_key_str = base64.b64decode(private_key_str)
-    private_key = ecdsa.SigningKey.from_string(private_key_str, curve=ecdsa.SECP256k1)
+    private_key = backend.load_private_key(private_key_str)
 
-    signature = private_key.sign(data.encode())
+    signature = backend.sign(private_key, data.encode())
 
     return base64.b64encode(signature).decode()
 
 
+def generate_signatures(data_items: List[Any], private_key_str: str) -> List[str]:
+    """Sign several data items with the same private key, parsing it only once.
+
+    Args:
+        data_items (List[Any]): Data to be signed
+        private_key_str (str): Previously generated private_key (in Base64)
+
+    Returns:
+        List[str]: Base64 encoded signatures, in the order of `data_items`
+    """
+    logging.info("Signing %d data item(s) with one key.", len(data_items))
+    backend = get_backend()
+    private_key = backend.load_private_key(base64.b64decode(private_key_str))
+
+    signatures = []
+    for data in data_items:
+        if not isinstance(data, str):
+            data = dump_data(data)
+        signature = backend.sign(private_key, data.encode())
+        signatures.append(base64.b64encode(signature).decode())
+
+    return signatures
+
+
 def verify_signature(data: Any, signature_str: str, public_key_str: str) -> bool:
     """Verify the signature of the given data using the provided public key.
 
@@ -98,24 +117,63 @@ def verify_signature(data: Any, signature_str: str, public_key_str: str) -> bool
             logging.debug("Data is not a string. Converting to JSON string.")
             data = dump_data(data)
 
+        backend = get_backend()
+
         logging.debug("Decoding public key from Base64.")
         public_key_str = base64.b64decode(public_key_str)
-        public_key = ecdsa.VerifyingKey.from_string(
-            public_key_str, curve=ecdsa.SECP256k1
-        )
+        public_key = backend.load_public_key(public_key_str)
 
         logging.debug("Decoding signature from Base64.")
         signature = base64.b64decode(signature_str)
 
         logging.info("Verifying the signature.")
-        result = public_key.verify(signature, data.encode())
-        logging.info("Signature verification successful.")
+        result = backend.verify(public_key, signature, data.encode())
+        if result:
+            logging.info("Signature verification successful.")
+        else:
+            logging.error("Signature verification failed: invalid signature")
         return result
     except Exception as e:
         logging.error("Signature verification failed: %s", str(e))
         return False
 
 
+def verify_signatures(items: List[Tuple[Any, str, str]]) -> List[bool]:
+    """Verify several signatures, parsing each distinct public key only once.
+
+    Args:
+        items (List[Tuple[Any, str, str]]): (data, signature_str, public_key_str)
+            tuples, with the signature and public key encoded in Base64.
+
+    Returns:
+        List[bool]: Whether each signature is valid, in the order of `items`.
+    """
+    logging.info("Verifying %d signature(s).", len(items))
+    backend = get_backend()
+    public_keys: Dict[str, Any] = {}
+
+    results = []
+    for data, signature_str, public_key_str in items:
+        try:
+            if not isinstance(data, str):
+                data = dump_data(data)
+
+            if public_key_str not in public_keys:
+                public_keys[public_key_str] = backend.load_public_key(
+                    base64.b64decode(public_key_str)
+                )
+
+            signature = base64.b64decode(signature_str)
+            results.append(
+                backend.verify(public_keys[public_key_str], signature, data.encode())
+            )
+        except Exception as e:
+            logging.error("Signature verification failed: %s", str(e))
+            results.append(False)
+
+    return results
+
+
 def get_timestamp() -> int:
     """Get the current timestamp in seconds since the epoch.
 
@@ -0,0 +1,257 @@
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Type
+
+# Raw encodings shared by every backend, so keys and signatures stay
+# interchangeable: 32-byte private scalar, 64-byte public point (x || y) and
+# 64-byte signature (r || s) over the SHA-1 digest of the data (the default
+# hash function of the `ecdsa` package).
+COORDINATE_SIZE = 32
+
+
+class EcdsaBackend(ABC):
+    name = ""
+
+    @abstractmethod
+    def generate_private_key(self) -> bytes:
+        """Generate a new secp256k1 private key.
+
+        Returns:
+            bytes: The raw 32-byte private key.
+        """
+
+    @abstractmethod
+    def get_public_key(self, private_key: bytes) -> bytes:
+        """Derive the public key of a private key.
+
+        Args:
+            private_key: The raw 32-byte private key.
+
+        Returns:
+            bytes: The raw 64-byte public key.
+        """
+
+    @abstractmethod
+    def load_private_key(self, private_key: bytes) -> Any:
+        """Parse a raw private key into the backend's signing key object.
+
+        Args:
+            private_key: The raw 32-byte private key.
+
+        Returns:
+            Any: A key object that can be reused by `sign`.
+        """
+
+    @abstractmethod
+    def load_public_key(self, public_key: bytes) -> Any:
+        """Parse a raw public key into the backend's verifying key object.
+
+        Args:
+            public_key: The raw 64-byte public key.
+
+        Returns:
+            Any: A key object that can be reused by `verify`.
+        """
+
+    @abstractmethod
+    def sign(self, signing_key: Any, data: bytes) -> bytes:
+        """Sign data.
+
+        Args:
+            signing_key: Key object returned by `load_private_key`.
+            data: The data to sign.
+
+        Returns:
+            bytes: The raw 64-byte signature.
+        """
+
+    @abstractmethod
+    def verify(self, verifying_key: Any, signature: bytes, data: bytes) -> bool:
+        """Verify the signature of data.
+
+        Args:
+            verifying_key: Key object returned by `load_public_key`.
+            signature: The raw 64-byte signature.
+            data: The signed data.
+
+        Returns:
+            bool: True if the signature is valid, False otherwise.
+        """
+
+
+class PythonEcdsaBackend(EcdsaBackend):
+    name = "ecdsa"
+
+    def __init__(self) -> None:
+        """Initialize the pure-Python backend built on the `ecdsa` package."""
+        import ecdsa
+
+        self.ecdsa = ecdsa
+        self.curve = ecdsa.SECP256k1
+
+    def generate_private_key(self) -> bytes:
+        return self.ecdsa.SigningKey.generate(curve=self.curve).to_string()
+
+    def get_public_key(self, private_key: bytes) -> bytes:
+        return self.load_private_key(private_key).get_verifying_key().to_string()
+
+    def load_private_key(self, private_key: bytes) -> Any:
+        return self.ecdsa.SigningKey.from_string(private_key, curve=self.curve)
+
+    def load_public_key(self, public_key: bytes) -> Any:
+        return self.ecdsa.VerifyingKey.from_string(public_key, curve=self.curve)
+
+    def sign(self, signing_key: Any, data: bytes) -> bytes:
+        return signing_key.sign(data)
+
+    def verify(self, verifying_key: Any, signature: bytes, data: bytes) -> bool:
+        try:
+            return verifying_key.verify(signature, data)
+        except self.ecdsa.BadSignatureError:
+            return False
+
+
+class CryptographyBackend(EcdsaBackend):
+    name = "cryptography"
+
+    def __init__(self) -> None:
+        """Initialize the native backend built on the `cryptography` package.
+
+        Raises:
+            ImportError: If `cryptography` is missing or lacks secp256k1 support.
+        """
+        from cryptography.exceptions import InvalidSignature, UnsupportedAlgorithm
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import ec, utils
+
+        self.ec = ec
+        self.utils = utils
+        self.curve = ec.SECP256K1()
+        self.algorithm = ec.ECDSA(hashes.SHA1())
+        self.invalid_signature = InvalidSignature
+
+        try:
+            ec.derive_private_key(1, self.curve)
+        except UnsupportedAlgorithm as e:
+            raise ImportError("secp256k1 is not supported by this build") from e
+
+    def generate_private_key(self) -> bytes:
+        private_key = self.ec.generate_private_key(self.curve)
+        return private_key.private_numbers().private_value.to_bytes(
+            COORDINATE_SIZE, "big"
+        )
+
+    def get_public_key(self, private_key: bytes) -> bytes:
+        numbers = self.load_private_key(private_key).public_key().public_numbers()
+        return numbers.x.to_bytes(COORDINATE_SIZE, "big") + numbers.y.to_bytes(
+            COORDINATE_SIZE, "big"
+        )
+
+    def load_private_key(self, private_key: bytes) -> Any:
+        return self.ec.derive_private_key(
+            int.from_bytes(private_key, "big"), self.curve
+        )
+
+    def load_public_key(self, public_key: bytes) -> Any:
+        if len(public_key) != 2 * COORDINATE_SIZE:
+            raise ValueError("Invalid public key length")
+        return self.ec.EllipticCurvePublicKey.from_encoded_point(
+            self.curve, b"\x04" + public_key
+        )
+
+    def sign(self, signing_key: Any, data: bytes) -> bytes:
+        r, s = self.utils.decode_dss_signature(signing_key.sign(data, self.algorithm))
+        return r.to_bytes(COORDINATE_SIZE, "big") + s.to_bytes(COORDINATE_SIZE, "big")
+
+    def verify(self, verifying_key: Any, signature: bytes, data: bytes) -> bool:
+        if len(signature) != 2 * COORDINATE_SIZE:
+            return False
+
+        r = int.from_bytes(signature[:COORDINATE_SIZE], "big")
+        s = int.from_bytes(signature[COORDINATE_SIZE:], "big")
+        try:
+            verifying_key.verify(
+                self.utils.encode_dss_signature(r, s), data, self.algorithm
+            )
+            return True
+        except self.invalid_signature:
+            return False
+
+
+# Candidates in order of preference, fastest first
+BACKENDS: Dict[str, Type[EcdsaBackend]] = {
+    CryptographyBackend.name: CryptographyBackend,
+    PythonEcdsaBackend.name: PythonEcdsaBackend,
+}
+
+# Environment variable forcing a backend by name
+BACKEND_ENV_VAR = "BLOCKCHAIN_ECDSA_BACKEND"
+
+_backend: Optional[EcdsaBackend] = None
+
+
+def available_backends() -> List[str]:
+    """List the backends that can be loaded on this machine.
+
+    Returns:
+        List[str]: Names of the usable backends, fastest first.
+    """
+    names = []
+    for name, backend_class in BACKENDS.items():
+        try:
+            backend_class()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_backend() -> EcdsaBackend:
+    """Get the ECDSA backend, selecting it on first use.
+
+    The backend named by the BLOCKCHAIN_ECDSA_BACKEND environment variable is
+    used if set, otherwise the fastest available one.
+
+    Returns:
+        EcdsaBackend: The selected backend.
+    """
+    global _backend
+    if _backend is None:
+        forced_name = os.environ.get(BACKEND_ENV_VAR)
+        if forced_name:
+            set_backend(forced_name)
+        else:
+            for backend_class in BACKENDS.values():
+                try:
+                    _backend = backend_class()
+                    break
+                except ImportError:
+                    logging.debug("ECDSA backend %s unavailable.", backend_class.name)
+
+            if _backend is None:
+                raise ImportError("No ECDSA backend available, install ecdsa")
+
+        logging.info("Using ECDSA backend: %s", _backend.name)
+    return _backend
+
+
+def set_backend(name: str) -> EcdsaBackend:
+    """Select an ECDSA backend by name.
+
+    Args:
+        name: One of the names in BACKENDS.
+
+    Returns:
+        EcdsaBackend: The selected backend.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the backend cannot be loaded on this machine.
+    """
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown ECDSA backend: {name}")
+
+    _backend = BACKENDS[name]()
+    return _backend
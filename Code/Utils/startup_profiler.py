@@ -0,0 +1,57 @@
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+
+class StartupProfiler:
+    def __init__(self, start: Optional[float] = None) -> None:
+        """Initialize a profiler that times the startup phases of the application.
+
+        Args:
+            start: `time.perf_counter()` value at process start (default is now).
+        """
+        self.start = start if start is not None else time.perf_counter()
+        self.phases: List[Tuple[str, float, List[str]]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a startup phase and record the modules it imports.
+
+        Args:
+            name: Name of the phase shown in the report.
+        """
+        modules_before = set(sys.modules)
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - phase_start
+            imported = sorted(
+                {module.split(".")[0] for module in set(sys.modules) - modules_before}
+            )
+            self.phases.append((name, duration, imported))
+
+    def elapsed(self) -> float:
+        """Get the time elapsed since process start.
+
+        Returns:
+            float: Elapsed time in seconds.
+        """
+        return time.perf_counter() - self.start
+
+    def report(self) -> str:
+        """Build a report of the recorded phases.
+
+        Returns:
+            str: The duration of each phase, the top-level packages it imported
+            and the total time to the first command.
+        """
+        lines = ["\n===== STARTUP PROFILE ====="]
+        for name, duration, imported in self.phases:
+            lines.append(f"{name:<28} {duration * 1000:>8.1f} ms")
+            if imported:
+                lines.append(f"  imports: {', '.join(imported)}")
+        lines.append(f"{'time to first command':<28} {self.elapsed() * 1000:>8.1f} ms")
+        lines.append("(run with `python -X importtime` for per-module import times)")
+        return "\n".join(lines)
@@ -1,6 +1,27 @@
-from Models.blockchain_application import BlockChainApplication
+import time
 
+START_TIME = time.perf_counter()
+
+import logging
+import sys
+from Utils.startup_profiler import StartupProfiler
 
 if __name__ == "__main__":
-    app = BlockChainApplication()
+    profiler = StartupProfiler(start=START_TIME)
+
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,  # Set log level to INFO
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+
+    with profiler.phase("import application"):
+        from Models.blockchain_application import BlockChainApplication
+
+    with profiler.phase("initialize application"):
+        app = BlockChainApplication()
+
+    if "--profile-startup" in sys.argv[1:]:
+        print(profiler.report())
+
     app.run()
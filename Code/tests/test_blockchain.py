@@ -0,0 +1,130 @@
+from typing import Dict, List, Tuple
+import pytest
+from Models.block import Block
+from Models.blockchain import BlockChain
+from Models.transaction import Transaction
+from Utils.crypto_utils import generate_keys_pairs
+
+DIFFICULTY = 1
+
+
+@pytest.fixture(scope="module")
+def wallets() -> Dict[str, Tuple[str, str]]:
+    return {name: generate_keys_pairs() for name in ("alice", "bob", "carol")}
+
+
+@pytest.fixture
+def blockchain() -> BlockChain:
+    return BlockChain(difficulty=DIFFICULTY)
+
+
+def transfer(wallets, sender: str, recipient: str, amount: float) -> Transaction:
+    private_key_str, sender_public_key_str = wallets[sender]
+    return Transaction(
+        sender=sender_public_key_str,
+        recipient=wallets[recipient][1],
+        amount=amount,
+        private_key=private_key_str,
+    )
+
+
+def mine_child(
+    blockchain: BlockChain, parent: Block, transactions: List[Transaction]
+) -> Block:
+    block = Block(
+        index=blockchain.heights[parent.hash] + 1,
+        previous_hash=parent.hash,
+        transactions=transactions,
+    )
+    block.mine_block(DIFFICULTY)
+    return block
+
+
+def chain_hashes(blockchain: BlockChain) -> List[str]:
+    return [block.hash for block in blockchain.chain]
+
+
+def test_lighter_side_branch_then_reorg(blockchain, wallets):
+    genesis = blockchain.get_latest_block()
+    a1 = blockchain.add_block([transfer(wallets, "alice", "bob", 1)])
+
+    b1 = blockchain.add_block(
+        [transfer(wallets, "alice", "carol", 2)], previous_hash=genesis.hash
+    )
+    assert chain_hashes(blockchain) == [genesis.hash, a1.hash]
+    assert b1.hash in blockchain.blocks
+
+    b2 = blockchain.add_block(
+        [transfer(wallets, "alice", "carol", 3)], previous_hash=b1.hash
+    )
+    assert chain_hashes(blockchain) == [genesis.hash, b1.hash, b2.hash]
+    assert blockchain.get_height() == 2
+
+
+def test_reorg_updates_balances_and_seen_transactions(blockchain, wallets):
+    genesis = blockchain.get_latest_block()
+    to_bob = transfer(wallets, "alice", "bob", 5)
+    to_carol = transfer(wallets, "alice", "carol", 7)
+    blockchain.add_block([to_bob])
+
+    b1 = blockchain.add_block([to_carol], previous_hash=genesis.hash)
+    blockchain.add_block([transfer(wallets, "bob", "carol", 1)], previous_hash=b1.hash)
+
+    alice, bob, carol = (wallets[name][1] for name in ("alice", "bob", "carol"))
+    assert not blockchain.has_transaction(to_bob.transaction_hash)
+    assert blockchain.has_transaction(to_carol.transaction_hash)
+    assert blockchain.get_balance(alice) == -7
+    assert blockchain.get_balance(bob) == -1
+    assert blockchain.get_balance(carol) == 8
+    assert set(blockchain.undo_data) == set(chain_hashes(blockchain))
+
+
+def test_failed_reorg_restores_old_tip(blockchain, wallets):
+    genesis = blockchain.get_latest_block()
+    a1 = blockchain.add_block([transfer(wallets, "alice", "bob", 1)])
+    a2 = blockchain.add_block([transfer(wallets, "alice", "bob", 2)])
+    balances = dict(blockchain.balances)
+    seen_transactions = set(blockchain.seen_transactions)
+
+    # B1 spends the same transaction twice, which only shows when it is connected
+    repeated = transfer(wallets, "alice", "carol", 3)
+    b1 = mine_child(blockchain, genesis, [repeated, repeated])
+    assert blockchain.receive_block(b1)
+    b2 = mine_child(blockchain, b1, [transfer(wallets, "alice", "carol", 4)])
+    b2_sibling = mine_child(blockchain, b1, [transfer(wallets, "alice", "carol", 5)])
+    assert blockchain.receive_block(b2)
+    assert blockchain.receive_block(b2_sibling)
+
+    b3 = mine_child(blockchain, b2, [transfer(wallets, "alice", "carol", 6)])
+    assert not blockchain.receive_block(b3)
+
+    assert chain_hashes(blockchain) == [genesis.hash, a1.hash, a2.hash]
+    assert blockchain.balances == balances
+    assert blockchain.seen_transactions == seen_transactions
+    for block in (b1, b2, b2_sibling, b3):
+        assert block.hash in blockchain.invalid_blocks
+        assert block.hash not in blockchain.blocks
+
+    # A branch built on a discarded block is refused, not a crash
+    b3_sibling = Block(
+        index=b2_sibling.index + 1,
+        previous_hash=b2_sibling.hash,
+        transactions=[transfer(wallets, "alice", "carol", 7)],
+    )
+    b3_sibling.mine_block(DIFFICULTY)
+    assert not blockchain.receive_block(b3_sibling)
+    assert chain_hashes(blockchain) == [genesis.hash, a1.hash, a2.hash]
+
+
+def test_from_dict_round_trip(blockchain, wallets):
+    blockchain.add_block([transfer(wallets, "alice", "bob", 1)])
+    blockchain.add_block([transfer(wallets, "bob", "carol", 2)])
+
+    restored = BlockChain.from_dict(blockchain.to_dict())
+
+    assert chain_hashes(restored) == chain_hashes(blockchain)
+    assert restored.difficulty == blockchain.difficulty
+    assert restored.balances == blockchain.balances
+    assert restored.seen_transactions == blockchain.seen_transactions
+    assert restored.cumulative_work == blockchain.cumulative_work
+    assert restored.is_valid_chain()
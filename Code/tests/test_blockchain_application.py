@@ -0,0 +1,100 @@
+import pytest
+from Models.blockchain_application import BlockChainApplication
+from Models.transaction_batch import PARALLEL_THRESHOLD
+
+
+def mine_transfers(app: BlockChainApplication, count: int) -> None:
+    # Amounts follow the height, so transfers made in the same second differ
+    for _ in range(count):
+        app.create_transaction("alice", "bob", app.blockchain.get_height() + 1)
+        assert app.mine_block()
+
+
+def assert_same_state(restarted, app) -> None:
+    assert restarted.blockchain.get_height() == app.blockchain.get_height()
+    assert (
+        restarted.blockchain.get_latest_block().hash
+        == app.blockchain.get_latest_block().hash
+    )
+    assert restarted.blockchain.balances == app.blockchain.balances
+    assert restarted.blockchain.seen_transactions == app.blockchain.seen_transactions
+
+
+def test_restart_replays_blocks_after_snapshot(tmp_path):
+    app = BlockChainApplication(data_dir=str(tmp_path), snapshot_interval=2)
+    app.adjust_difficulty(1)
+    mine_transfers(app, 3)
+
+    assert app.chain_store.load_snapshot()["height"] == 2
+    assert [block.index for block in app.chain_store.read_blocks()] == [3]
+
+    restarted = BlockChainApplication(data_dir=str(tmp_path), snapshot_interval=2)
+    assert_same_state(restarted, app)
+    assert restarted.blockchain.base_height == 2
+    assert restarted.keystore.get("alice") == app.keystore.get("alice")
+
+    # The restarted node keeps extending the same chain
+    mine_transfers(restarted, 1)
+    assert restarted.blockchain.get_height() == 4
+
+
+@pytest.mark.parametrize("persisted", [True, False])
+def test_restart_after_lowering_difficulty(tmp_path, persisted):
+    app = BlockChainApplication(data_dir=str(tmp_path))
+    if persisted:
+        app.adjust_difficulty(1)
+    else:
+        app.blockchain.adjust_difficulty(1)
+    mine_transfers(app, 3)
+
+    restarted = BlockChainApplication(data_dir=str(tmp_path))
+    assert_same_state(restarted, app)
+    assert restarted.blockchain.difficulty == (1 if persisted else 2)
+
+
+def test_pruning_keeps_state_across_restart(tmp_path):
+    app = BlockChainApplication(data_dir=str(tmp_path), prune_depth=1)
+    app.adjust_difficulty(1)
+    mine_transfers(app, 3)
+
+    chain = app.blockchain.chain
+    assert app.blockchain.pruned_height == 2
+    assert all(block.is_pruned() for block in chain[:-1])
+    assert not chain[-1].is_pruned()
+    assert set(app.blockchain.undo_data) == {chain[-1].hash}
+
+    restarted = BlockChainApplication(data_dir=str(tmp_path), prune_depth=1)
+    assert_same_state(restarted, app)
+
+
+def test_prune_depth_must_be_positive():
+    with pytest.raises(ValueError):
+        BlockChainApplication(prune_depth=0)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_create_transactions_results_follow_input_order(processes):
+    app = BlockChainApplication()
+    transfers = []
+    for i in range(PARALLEL_THRESHOLD + 6):
+        # Every fifth transfer cannot be built: negative or non-numeric amount
+        amount = (-i if i % 2 else "ten") if i % 5 == 0 else i
+        transfers.append((f"sender-{i % 7}", f"recipient-{i % 3}", amount))
+
+    report = app.create_transactions(transfers, processes=processes)
+
+    assert len(report["results"]) == len(transfers)
+    added = 0
+    for (sender, recipient, amount), result in zip(transfers, report["results"]):
+        transaction = result["transaction"]
+        if isinstance(amount, str) or amount <= 0:
+            assert transaction is None
+            assert not result["added"]
+            assert result["error"]
+        else:
+            assert result["added"] and result["error"] is None
+            assert transaction.amount == amount
+            assert transaction.sender == app.keystore.get(sender)[1]
+            assert transaction.recipient == app.keystore.get(recipient)[1]
+            added += 1
+    assert report["added"] == app.transaction_pool.size() == added
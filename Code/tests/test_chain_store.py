@@ -0,0 +1,42 @@
+import os
+from Models.blockchain import BlockChain
+from Models.chain_store import ChainStore
+from Models.transaction import Transaction
+
+
+def mine_blocks(blockchain: BlockChain, count: int) -> None:
+    for amount in range(1, count + 1):
+        blockchain.add_block(
+            [Transaction(sender="network", recipient="miner", amount=amount)]
+        )
+
+
+def test_snapshot_compacts_block_log(tmp_path):
+    store = ChainStore(str(tmp_path))
+    blockchain = BlockChain(difficulty=1)
+    mine_blocks(blockchain, 4)
+    for block in blockchain.chain[1:]:
+        store.append_block(block)
+
+    snapshot = blockchain.to_snapshot()
+    mine_blocks(blockchain, 2)
+    for block in blockchain.chain[-2:]:
+        store.append_block(block)
+    store.save_snapshot(snapshot)
+
+    assert store.load_snapshot() == snapshot
+    assert [block.index for block in store.read_blocks()] == [5, 6]
+    assert [block.hash for block in store.read_blocks()] == [
+        block.hash for block in blockchain.chain[-2:]
+    ]
+    assert sorted(os.listdir(tmp_path)) == [
+        ChainStore.BLOCKS_FILE,
+        ChainStore.SNAPSHOT_FILE,
+    ]
+
+
+def test_empty_store(tmp_path):
+    store = ChainStore(str(tmp_path / "node"))
+
+    assert store.load_snapshot() is None
+    assert store.read_blocks() == []
@@ -0,0 +1,46 @@
+import itertools
+import pytest
+from Utils.ecdsa_backends import BACKENDS, available_backends
+
+MESSAGE = b"0" * 128
+
+BACKEND_PAIRS = list(itertools.product(available_backends(), repeat=2))
+
+
+@pytest.fixture(params=BACKEND_PAIRS, ids=[f"{s}-{v}" for s, v in BACKEND_PAIRS])
+def signer_and_verifier(request):
+    signer_name, verifier_name = request.param
+    return BACKENDS[signer_name](), BACKENDS[verifier_name]()
+
+
+def test_public_keys_match(signer_and_verifier):
+    signer, verifier = signer_and_verifier
+    private_key = signer.generate_private_key()
+
+    assert verifier.get_public_key(private_key) == signer.get_public_key(private_key)
+
+
+def test_signature_verifies(signer_and_verifier):
+    signer, verifier = signer_and_verifier
+    private_key = signer.generate_private_key()
+    signature = signer.sign(signer.load_private_key(private_key), MESSAGE)
+    verifying_key = verifier.load_public_key(signer.get_public_key(private_key))
+
+    assert verifier.verify(verifying_key, signature, MESSAGE)
+
+
+def test_tampered_message_rejected(signer_and_verifier):
+    signer, verifier = signer_and_verifier
+    private_key = signer.generate_private_key()
+    signature = signer.sign(signer.load_private_key(private_key), MESSAGE)
+    verifying_key = verifier.load_public_key(signer.get_public_key(private_key))
+
+    assert not verifier.verify(verifying_key, signature, MESSAGE + b"1")
+
+
+def test_zeroed_signature_rejected(signer_and_verifier):
+    signer, verifier = signer_and_verifier
+    private_key = signer.generate_private_key()
+    verifying_key = verifier.load_public_key(signer.get_public_key(private_key))
+
+    assert not verifier.verify(verifying_key, bytes(64), MESSAGE)
@@ -0,0 +1,61 @@
+import os
+import stat
+import pytest
+from Models.keystore import PARALLEL_THRESHOLD, KeyStore
+
+
+def test_wallets_persist_across_reload(tmp_path):
+    path = str(tmp_path / "wallets.jsonl")
+    keystore = KeyStore(path)
+    keystore.generate_wallets(["alice", "bob"])
+    keystore.create_wallet("carol")
+
+    reloaded = KeyStore(path)
+
+    assert list(reloaded) == ["alice", "bob", "carol"]
+    assert dict(reloaded.items()) == dict(keystore.items())
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_get_name_finds_wallet_by_address(tmp_path):
+    path = str(tmp_path / "wallets.jsonl")
+    _, public_key_str = KeyStore(path).create_wallet("alice")
+
+    reloaded = KeyStore(path)
+
+    assert reloaded.get_name(public_key_str) == "alice"
+    assert reloaded.get_name("unknown-address") is None
+
+
+@pytest.mark.parametrize(
+    "names, message",
+    [
+        (["alice"], r"\['alice'\] already exist"),
+        (["bob", "bob"], r"\['bob'\] repeated"),
+    ],
+)
+def test_duplicate_names_rejected(tmp_path, names, message):
+    path = str(tmp_path / "wallets.jsonl")
+    keystore = KeyStore(path)
+    keystore.create_wallet("alice")
+
+    with pytest.raises(ValueError, match=message):
+        keystore.generate_wallets(names)
+
+    assert list(keystore) == ["alice"]
+    assert list(KeyStore(path)) == ["alice"]
+
+
+def test_process_pool_generates_distinct_wallets(tmp_path):
+    path = str(tmp_path / "wallets.jsonl")
+    names = [f"wallet-{i}" for i in range(PARALLEL_THRESHOLD)]
+
+    key_pairs = KeyStore(path).generate_wallets(names, processes=2)
+
+    reloaded = KeyStore(path)
+    assert len({public_key_str for _, public_key_str in key_pairs}) == len(names)
+    assert [reloaded.get(name) for name in names] == key_pairs
+    assert all(
+        reloaded.get_name(public_key_str) == name
+        for name, (_, public_key_str) in zip(names, key_pairs)
+    )
@@ -0,0 +1,125 @@
+import sys
+import threading
+import time
+from typing import List
+import pytest
+from Models.keystore import KeyStore
+from Models.transaction import Transaction
+from Models.transaction_batch import sign_transactions
+from Models.transaction_pool import (
+    ALREADY_CONFIRMED,
+    DUPLICATE,
+    INVALID,
+    TransactionPool,
+)
+
+WALLETS = 10
+TRANSACTIONS = 200
+BLOCK_SIZE = 20
+
+
+@pytest.fixture(scope="module")
+def transactions() -> List[Transaction]:
+    keystore = KeyStore()
+    names = [f"wallet-{i}" for i in range(WALLETS)]
+    keystore.generate_wallets(names)
+
+    requests = []
+    for i in range(TRANSACTIONS):
+        private_key_str, sender = keystore.get(names[i % WALLETS])
+        _, recipient = keystore.get(names[(i + 1) % WALLETS])
+        requests.append((private_key_str, sender, recipient, i + 1))
+    return [transaction for transaction, _ in sign_transactions(requests)]
+
+
+@pytest.fixture
+def frequent_thread_switches():
+    # Switch threads far more often than the default to surface races
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.mark.usefixtures("frequent_thread_switches")
+@pytest.mark.parametrize("producers", [2, 8])
+def test_concurrent_producers_and_miner(transactions, producers):
+    pool = TransactionPool()
+    mined: List[str] = []
+    results: List[bool] = []
+    producing = threading.Event()
+    producing.set()
+
+    def produce(chunk: List[Transaction]) -> None:
+        results.extend(pool.add_transaction(transaction) for transaction in chunk)
+
+    def mine() -> None:
+        while producing.is_set() or pool.size():
+            selected = pool.get_pending_transactions(limit=BLOCK_SIZE)
+            if not selected:
+                time.sleep(0.001)
+                continue
+            mined.extend(transaction.transaction_hash for transaction in selected)
+            pool.remove_transactions(selected)
+
+    chunks = [transactions[i::producers] for i in range(producers)]
+    threads = [threading.Thread(target=produce, args=(chunk,)) for chunk in chunks]
+    miner = threading.Thread(target=mine)
+    miner.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    producing.clear()
+    miner.join()
+
+    assert len(results) == TRANSACTIONS and all(results), "a transaction was rejected"
+    assert len(mined) == len(set(mined)), "a transaction was mined twice"
+    assert set(mined) == {
+        t.transaction_hash for t in transactions
+    }, "a transaction was lost"
+    assert pool.size() == 0
+
+
+def test_duplicate_rejected_under_contention(transactions):
+    pool = TransactionPool()
+    results: List[bool] = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(pool.add_transaction(transactions[0]))
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(True) == 1
+    assert pool.size() == 1
+
+
+def test_add_transactions_reports_rejection_reasons(transactions):
+    confirmed, pending, duplicate, forged, fresh = transactions[:5]
+    forged = Transaction.from_dict({**forged.to_dict(), "signature": fresh.signature})
+    pool = TransactionPool(
+        is_confirmed=lambda transaction_hash: transaction_hash
+        == confirmed.transaction_hash
+    )
+    assert pool.add_transaction(pending)
+
+    errors = pool.add_transactions(
+        [confirmed, pending, duplicate, duplicate, forged, fresh]
+    )
+
+    assert errors == [
+        ALREADY_CONFIRMED,
+        DUPLICATE,
+        None,
+        DUPLICATE,
+        INVALID,
+        None,
+    ]
+    assert pool.transaction_hashes == {
+        transaction.transaction_hash for transaction in (pending, duplicate, fresh)
+    }